@@ -11,6 +11,9 @@ import pandas as pd
 if TYPE_CHECKING:
     from typing_extensions import Self
 
+# Valid targets for sorting data
+_SORT_TARGETS = frozenset({"column", "row"})
+
 
 class Eads:
     """Handle adsorption energies as pandas.DataFrame.
@@ -27,8 +30,16 @@ class Eads:
         - Column headers (0th row) should be adsorbate names.
         - Row headers (0th column) should be sample names.
 
+    Internally the energies are stored as a contiguous float64 array,
+    with sample/adsorbate names as pd.Index (for hashed lookup).
+    The DataFrame (as a copy) is only built on access of data.
+
+    New samples/adsorbates are buffered and merged into the array in a
+    single stack (on flush or the next access), to avoid reallocating
+    the whole array for each insertion.
+
     Attributes:
-        df (pd.DataFrame): The DataFrame containing adsorption energy data.
+        data (pd.DataFrame): The DataFrame containing adsorption energy data.
     """
 
     def __init__(
@@ -37,6 +48,14 @@ class Eads:
     ) -> None:
         """Initialize the Eads class with a DataFrame."""
 
+        # Buffers for samples/adsorbates pending to be merged
+        self._pending_samples: dict[str, np.ndarray] = {}
+        self._pending_adsorbates: dict[str, np.ndarray] = {}
+
+        # Cached adsorbate/sample names
+        self._adsorbates_cache: list[str] | None = None
+        self._samples_cache: list[str] | None = None
+
         # Set property: data
         self.data = data
 
@@ -57,9 +76,20 @@ class Eads:
             where:
                 - Column headers (0th row) should be adsorbate names.
                 - Row headers (0th column) should be sample names.
+
+        Note: a new DataFrame (copy of data) is built on each access,
+            in place edits to it thus do not apply. Modify data through
+            the setter or the add/remove methods instead.
         """
 
-        return self._data
+        self.flush()
+
+        return pd.DataFrame(
+            self._values,
+            index=self._samples,
+            columns=self._adsorbates,
+            copy=True,
+        )
 
     @data.setter
     def data(
@@ -76,37 +106,65 @@ class Eads:
             ValueError: If conversion of DataFrame elements to float fails.
         """
 
-        if isinstance(
-            data,
-            pd.DataFrame,
-        ):
-            try:
-                data = data.astype(float)
-            except ValueError as e:
-                raise ValueError(
-                    "Please double-check input data type, expect floats."
-                ) from e
-
-        else:
+        if not isinstance(data, pd.DataFrame):
             raise TypeError("Expect data as pd.DataFrame type.")
 
-        self._data = data
+        # Cast as a single contiguous array (faster than block-wise
+        # pd.DataFrame.astype), always copied to never alias input data
+        try:
+            values = np.array(
+                data.to_numpy(dtype=np.float64), order="C", copy=True
+            )
+        except ValueError as e:
+            raise ValueError(
+                "Please double-check input data type, expect floats."
+            ) from e
+
+        self._values: np.ndarray = values
+        self._samples: pd.Index = data.index
+        self._adsorbates: pd.Index = data.columns
+
+        # Drop pending samples/adsorbates of previous data
+        self._pending_samples = {}
+        self._pending_adsorbates = {}
+
+        self._clear_cache()
+
+    def _clear_cache(self) -> None:
+        """Invalidate cached adsorbate/sample names."""
+
+        self._adsorbates_cache = None
+        self._samples_cache = None
 
     @property
     def adsorbates(
         self,
     ) -> list[str]:
-        """Adsorbate names (from column headers)."""
+        """Adsorbate names (from column headers).
+
+        Note: the list is cached, do not modify it in place.
+        """
 
-        return self.data.columns.values.tolist()
+        if self._adsorbates_cache is None:
+            self.flush()
+            self._adsorbates_cache = self._adsorbates.tolist()
+
+        return self._adsorbates_cache
 
     @property
     def samples(
         self,
     ) -> list[str]:
-        """Sample names (from row headers)."""
+        """Sample names (from row headers).
+
+        Note: the list is cached, do not modify it in place.
+        """
+
+        if self._samples_cache is None:
+            self.flush()
+            self._samples_cache = self._samples.tolist()
 
-        return self.data.index.tolist()
+        return self._samples_cache
 
     @classmethod
     def from_csv(cls, csv_file: str | Path) -> Self:
@@ -133,11 +191,43 @@ class Eads:
             np.ndarray: An array containing the adsorbate data as floats.
         """
 
+        self.flush()
+
         # Get the column index
-        col_index = self.data.columns.get_loc(name)
+        col_index = self._adsorbates.get_loc(name)
 
         # Extract the column data as a numpy array of floats
-        return self.data.iloc[:, col_index].values
+        return self._values[:, col_index]
+
+    def get_adsorbates(
+        self,
+        names: list[str],
+    ) -> np.ndarray:
+        """
+        Get the columns for given adsorbate names in a single take.
+
+        Parameters:
+            names (list[str]): The names of the adsorbates.
+
+        Returns:
+            np.ndarray: A (new) array of shape (n_samples, len(names))
+                containing the adsorbate data as floats.
+
+        Raises:
+            KeyError: If any adsorbate is not found.
+        """
+
+        self.flush()
+
+        col_indexes = self._adsorbates.get_indexer(names)
+
+        if (col_indexes < 0).any():
+            missing = [
+                name for name, idx in zip(names, col_indexes) if idx < 0
+            ]
+            raise KeyError(f"Adsorbates {missing} not found.")
+
+        return self._values[:, col_indexes]
 
     def get_sample(
         self,
@@ -153,7 +243,9 @@ class Eads:
             np.ndarray: An array containing the sample data as floats.
         """
 
-        return self.data.loc[name].values
+        self.flush()
+
+        return self._values[self._samples.get_loc(name)]
 
     def add_adsorbate(
         self,
@@ -172,17 +264,24 @@ class Eads:
                 match the number of samples, or if the adsorbate exists.
         """
 
+        # Merge pending samples first to get the final number of samples
+        if self._pending_samples:
+            self.flush()
+
         # Check new entry length
-        if len(energies) != len(self.data):
+        if len(energies) != len(self._samples):
             raise ValueError(
                 "New adsorbate energies length doesn't match others."
             )
 
-        if name in self.data.columns.values:
+        if name in self._adsorbates or name in self._pending_adsorbates:
             raise ValueError(f"Adsorbate {name} already exists.")
 
         else:
-            self.data[name] = energies
+            self._pending_adsorbates[name] = np.array(
+                energies, dtype=np.float64
+            )
+            self._adsorbates_cache = None
 
     def add_sample(
         self,
@@ -201,16 +300,48 @@ class Eads:
                 the number of adsorbates, or if the sample name already exists.
         """
 
-        if len(energies) != len(self.data.columns):
+        # Merge pending adsorbates first to get the final number of columns
+        if self._pending_adsorbates:
+            self.flush()
+
+        if len(energies) != len(self._adsorbates):
             raise ValueError(
                 "New sample energies length doesn't match others."
             )
 
-        if name in self.data.index:
+        if name in self._samples or name in self._pending_samples:
             raise ValueError(f"Sample {name} already exists.")
 
         else:
-            self.data.loc[name] = energies
+            self._pending_samples[name] = np.array(energies, dtype=np.float64)
+            self._samples_cache = None
+
+    def flush(self) -> None:
+        """Merge pending samples/adsorbates into data with a single stack.
+
+        Called automatically whenever data is accessed.
+        """
+
+        if self._pending_samples:
+            self._values = np.vstack(
+                [self._values, *self._pending_samples.values()]
+            )
+            self._samples = self._samples.append(
+                pd.Index(list(self._pending_samples), name=self._samples.name)
+            )
+            self._pending_samples = {}
+
+        if self._pending_adsorbates:
+            self._values = np.column_stack(
+                [self._values, *self._pending_adsorbates.values()]
+            )
+            self._adsorbates = self._adsorbates.append(
+                pd.Index(
+                    list(self._pending_adsorbates),
+                    name=self._adsorbates.name,
+                )
+            )
+            self._pending_adsorbates = {}
 
     def remove_adsorbate(
         self,
@@ -222,7 +353,13 @@ class Eads:
             name (str): The name of the adsorbate column to be removed.
         """
 
-        self.data.drop(columns=name, inplace=True)
+        self.flush()
+
+        col_index = self._adsorbates.get_loc(name)
+
+        self._values = np.delete(self._values, col_index, axis=1)
+        self._adsorbates = self._adsorbates.delete(col_index)
+        self._adsorbates_cache = None
 
     def remove_sample(
         self,
@@ -234,10 +371,13 @@ class Eads:
             name (str): The name of the sample row to be removed.
         """
 
-        self.data.drop(
-            index=name,
-            inplace=True,
-        )
+        self.flush()
+
+        row_index = self._samples.get_loc(name)
+
+        self._values = np.delete(self._values, row_index, axis=0)
+        self._samples = self._samples.delete(row_index)
+        self._samples_cache = None
 
     def sort_data(
         self,
@@ -245,21 +385,28 @@ class Eads:
     ) -> None:
         """Sort columns/rows of data."""
         if targets is None:
-            _targets: set[str] = {"column", "row"}
+            _targets: frozenset[str] = _SORT_TARGETS
 
         else:
-            _targets = set(targets)
+            _targets = frozenset(targets)
 
-            if not (
-                _targets.issubset({"column", "row"})
-                or _targets == {"column", "row"}
-            ):
+            if not _targets.issubset(_SORT_TARGETS):
                 raise ValueError(
                     "Invalid target. Should be 'column', 'row', or both."
                 )
 
+        self.flush()
+
         if "column" in _targets:
-            self.data = self.data.sort_index(axis=1)
+            order = self._adsorbates.argsort()
+
+            self._values = self._values[:, order]
+            self._adsorbates = self._adsorbates[order]
 
         if "row" in _targets:
-            self.data = self.data.sort_index()
+            order = self._samples.argsort()
+
+            self._values = self._values[order]
+            self._samples = self._samples[order]
+
+        self._clear_cache()
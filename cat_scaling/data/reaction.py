@@ -11,15 +11,27 @@ import re
 import warnings
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 from cat_scaling.data.species import Species
 
 if TYPE_CHECKING:
     from typing_extensions import Self
 
+# Leading chars of stoichiometric numbers
+_DIGITS = "0123456789"
+
+# Separators of reactants/products and species
+# NOTE: whitespace is required around "+" to allow names like "H+"
+_ARROW_RE = re.compile(r"\s*->\s*")
+_PLUS_RE = re.compile(r"\s+\+\s+")
+
 
 class ReactionStep:
     """Represent a single reaction step within a Reaction."""
 
+    __slots__ = ("_products", "_reactants", "_stoi")
+
     def __init__(
         self,
         reactants: dict[Species, float],
@@ -48,47 +60,55 @@ class ReactionStep:
                 stoichiometric numbers.
         """
 
+        # Cached stoichiometry, reset by setters
+        self._stoi: tuple[tuple[Species, ...], np.ndarray] | None = None
+
         self.reactants = reactants
         self.products = products
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, ReactionStep):
             return False
 
-        if (
-            self.reactants == other.products
-            and self.products == other.reactants
-        ):
-            warnings.warn("Found a reverse reaction step.")
+        # Steps with different hashes can only be reverse steps
+        if hash(self) != hash(other):
+            if (
+                self._reactants == other._products
+                and self._products == other._reactants
+            ):
+                warnings.warn("Found a reverse reaction step.")
+
+            return False
 
         return (
-            self.reactants == other.reactants
-            and self.products == other.products
+            self._reactants == other._reactants
+            and self._products == other._products
         )
 
     def __str__(self) -> str:
-        # Add reactants
-        reactants = []
-        for spec, num in self.reactants.items():
-            name = f"*{spec.name}" if spec.adsorbed else spec.name
-
-            reactants.append(f"{num}{name}")
-
-        # Add products
-        products = []
-        for spec, num in self.products.items():
-            name = f"*{spec.name}" if spec.adsorbed else spec.name
-
-            products.append(f"{num}{name}")
-
-        # Assemble
-        return " + ".join(reactants) + " -> " + " + ".join(products)
+        # NOTE: not cached, as Species (names/adsorbed) are mutable
+        # Assemble reactants and products, e.g. "2.0*CO2"
+        return (
+            " + ".join(
+                f"{num}{'*' if spec.adsorbed else ''}{spec.name}"
+                for spec, num in self._reactants.items()
+            )
+            + " -> "
+            + " + ".join(
+                f"{num}{'*' if spec.adsorbed else ''}{spec.name}"
+                for spec, num in self._products.items()
+            )
+        )
 
     def __hash__(self) -> int:
+        # NOTE: not cached, as Species hashes follow their (mutable) energies
         return hash(
             (
-                frozenset(self.reactants.items()),
-                frozenset(self.products.items()),
+                frozenset(self._reactants.items()),
+                frozenset(self._products.items()),
             )
         )
 
@@ -99,6 +119,9 @@ class ReactionStep:
 
     @reactants.setter
     def reactants(self, reactants: dict[Species, float]):
+        # Validate and convert to float in a single pass
+        # (dict.fromkeys of a dict is pre-sized, avoiding rehashing)
+        _reactants: dict[Species, float] = dict.fromkeys(reactants, 0.0)
         for species, num in reactants.items():
             if not isinstance(species, Species):
                 raise TypeError("Expect type Species for species.")
@@ -106,10 +129,14 @@ class ReactionStep:
             if not isinstance(num, (float, int)):
                 raise TypeError("Stoichiometric number should be float.")
 
-            if num < 0:
-                warnings.warn("Negative stoichiometric number found.")
+            _reactants[species] = float(num)
+
+        # Warn once for all negative stoichiometric numbers
+        if any(num < 0 for num in _reactants.values()):
+            warnings.warn("Negative stoichiometric number found.")
 
-        self._reactants = {k: float(v) for k, v in reactants.items()}
+        self._reactants = _reactants
+        self._clear_cache()
 
     @property
     def products(self) -> dict[Species, float]:
@@ -118,6 +145,9 @@ class ReactionStep:
 
     @products.setter
     def products(self, products: dict[Species, float]):
+        # Validate and convert to float in a single pass
+        # (dict.fromkeys of a dict is pre-sized, avoiding rehashing)
+        _products: dict[Species, float] = dict.fromkeys(products, 0.0)
         for species, num in products.items():
             if not isinstance(species, Species):
                 raise TypeError("Expect type Species for species.")
@@ -125,10 +155,47 @@ class ReactionStep:
             if not isinstance(num, (float, int)):
                 raise TypeError("Stoichiometric number should be float.")
 
-            if num < 0:
-                warnings.warn("Negative stoichiometric number found.")
+            _products[species] = float(num)
+
+        # Warn once for all negative stoichiometric numbers
+        if any(num < 0 for num in _products.values()):
+            warnings.warn("Negative stoichiometric number found.")
+
+        self._products = _products
+        self._clear_cache()
+
+    def _clear_cache(self) -> None:
+        """Invalidate cached stoichiometry."""
+
+        self._stoi = None
+
+    @property
+    def stoichiometry(self) -> tuple[tuple[Species, ...], np.ndarray]:
+        """Species and signed stoichiometric numbers as parallel arrays.
+
+        Species are ordered as reactants then products, and stoichiometric
+        numbers are negative for reactants. For example:
+            *A + 2H2O_g -> 2*B
+            gives ((*A, H2O_g, *B), array([-1., -2., 2.]))
+
+        Note: the result is cached, the array is thus read-only.
+        """
+
+        if self._stoi is None:
+            species = (*self._reactants, *self._products)
+
+            numbers = np.array(
+                [
+                    *(-num for num in self._reactants.values()),
+                    *self._products.values(),
+                ],
+                dtype=np.float64,
+            )
+            numbers.flags.writeable = False
 
-        self._products = {k: float(v) for k, v in products.items()}
+            self._stoi = (species, numbers)
+
+        return self._stoi
 
     @staticmethod
     def _sepa_stoi_number(name: str) -> tuple[float, str]:
@@ -143,18 +210,18 @@ class ReactionStep:
         """
         name = name.strip()
 
-        # Use re to separate leading digits and name
-        if match := re.match(r"^(\d+(\.\d+)?)(.*)$", name):
-            stoi_number_str = match[1]
-            species_name = match[3]
-
-        else:
-            stoi_number_str = ""
-            species_name = name
+        # Strip leading digits (integer part)
+        rest = name.lstrip(_DIGITS)
+        if len(rest) == len(name):
+            return 1.0, name
 
-        stoi_number: float = float(stoi_number_str) if stoi_number_str else 1.0
+        # Strip optional decimal part (only if followed by a digit)
+        if rest.startswith("."):
+            frac_rest = rest[1:].lstrip(_DIGITS)
+            if len(frac_rest) < len(rest) - 1:
+                rest = frac_rest
 
-        return stoi_number, species_name
+        return float(name[: len(name) - len(rest)]), rest
 
     @classmethod
     def from_str(cls, string: str, energy_dict: dict) -> Self:
@@ -164,7 +231,8 @@ class ReactionStep:
             *A + 2H2O_g -> 2*B
 
         Notes:
-            1. Use " + "(whitespace in BOTH sides) to separate species
+            1. Use " + "(whitespace in BOTH sides, any amount)
+                to separate species
             2. Use "->" to separate reactants and products
             3. For species name format refers to the from_str method
                 of Species class
@@ -187,37 +255,86 @@ class ReactionStep:
         if not isinstance(string, str):
             raise TypeError("Expect a string.")
 
-        string_parts = string.split("->")
+        return cls._from_str(string, energy_dict, species_cache={})
+
+    @classmethod
+    def _from_str(
+        cls,
+        string: str,
+        energy_dict: dict,
+        species_cache: dict[str, Species],
+    ) -> Self:
+        """Worker for from_str, reusing Species objects in species_cache.
+
+        The species_cache maps species names (for example "*CO2") to
+        Species objects, so that the same species shared across steps
+        (of a Reaction parsed with the same energy_dict) would be
+        initialized only once.
+        """
+
+        string_parts = _ARROW_RE.split(string)
         if len(string_parts) != 2:
             raise ValueError("Invalid ReactionStep str.")
 
         # Split entire string into species parts
-        react_parts = string_parts[0].split(" + ")
-        product_parts = string_parts[1].split(" + ")
+        react_parts = _PLUS_RE.split(string_parts[0])
+        product_parts = _PLUS_RE.split(string_parts[1])
+
+        # Parsed stoichiometric numbers are non-negative floats
+        return cls._from_validated(
+            reactants=cls._parse_species(
+                react_parts, energy_dict, species_cache
+            ),
+            products=cls._parse_species(
+                product_parts, energy_dict, species_cache
+            ),
+        )
 
-        # Convert each species str to Species for reactants
-        react_specs = {}
-        for part in react_parts:
-            # Separate species_str: "2*CO2(-1, 0)" -> (2.0, "*CO2(-1, 0)")
-            number, species_name = cls._sepa_stoi_number(part)
+    @classmethod
+    def _from_validated(
+        cls,
+        reactants: dict[Species, float],
+        products: dict[Species, float],
+    ) -> Self:
+        """Initialize from already validated reactants and products,
+        bypassing the checks in the setters.
 
-            # Recompile species str to include energy
-            species_name = (
-                f"{species_name}{energy_dict[species_name.lstrip('*')]}"
-            )
-            react_specs[Species.from_str(species_name)] = number
+        Expect Species as keys and non-negative floats as values.
+        """
 
-        # Convert products
-        product_specs = {}
-        for part in product_parts:
+        step = cls.__new__(cls)
+        step._reactants = reactants
+        step._products = products
+        step._clear_cache()
+
+        return step
+
+    @classmethod
+    def _parse_species(
+        cls,
+        parts: list[str],
+        energy_dict: dict,
+        species_cache: dict[str, Species],
+    ) -> dict[Species, float]:
+        """Convert species strs (for example "2*CO2") to
+        dict{Species: stoichiometric_number}.
+        """
+
+        specs = {}
+        for part in parts:
+            # Separate species_str: "2*CO2" -> (2.0, "*CO2")
             number, species_name = cls._sepa_stoi_number(part)
 
-            species_name = (
-                f"{species_name}{energy_dict[species_name.lstrip('*')]}"
-            )
-            product_specs[Species.from_str(species_name)] = number
+            if (species := species_cache.get(species_name)) is None:
+                # Recompile species str to include energy
+                species = Species.from_str(
+                    f"{species_name}{energy_dict[species_name.lstrip('*')]}"
+                )
+                species_cache[species_name] = species
 
-        return cls(reactants=react_specs, products=product_specs)
+            specs[species] = number
+
+        return specs
 
 
 class Reaction:
@@ -247,10 +364,14 @@ class Reaction:
         if not all(isinstance(i, ReactionStep) for i in reaction_steps):
             raise TypeError("Each step should be ReactionStep.")
 
-        if len(reaction_steps) != len(set(reaction_steps)):
-            raise ValueError("Duplicate ReactionStep found.")
+        # Check for duplicate (stop at the first one)
+        seen_steps: set[ReactionStep] = set()
+        for step in reaction_steps:
+            if step in seen_steps:
+                raise ValueError("Duplicate ReactionStep found.")
+            seen_steps.add(step)
 
-        self._reaction_steps = reaction_steps
+        self._reaction_steps = list(reaction_steps)
 
     @classmethod
     def from_str(cls, string: str, energy_dict: dict) -> Self:
@@ -263,10 +384,15 @@ class Reaction:
         if not isinstance(string, str):
             raise TypeError("Expect a str.")
 
+        # Share Species objects across steps
+        species_cache: dict[str, Species] = {}
+
         reaction_steps = []
         str_parts = string.strip().split("\n")
         for step in str_parts:
-            reaction_steps.append(ReactionStep.from_str(step, energy_dict))
+            reaction_steps.append(
+                ReactionStep._from_str(step, energy_dict, species_cache)
+            )
 
         assert reaction_steps, "Empty elements in Reaction"
         return cls(reaction_steps)
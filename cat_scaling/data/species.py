@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 import warnings
 from math import isclose
 from typing import TYPE_CHECKING, Any
@@ -9,10 +10,15 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from typing_extensions import Self
 
+# Species str: "*SpeciesName(energy, correction)"
+_SPECIES_RE = re.compile(r"(\*?)\**([^()]*)\(([^,()]*),([^,()]*)\)")
+
 
 class Species:
     """Represent a species for a surface reaction."""
 
+    __slots__ = ("_adsorbed", "_correction", "_energy", "_hash", "_name")
+
     def __init__(
         self,
         name: str,
@@ -28,6 +34,8 @@ class Species:
             adsorbed (bool): Whether the species is adsorbed on the surface.
         """
 
+        self._hash: int | None = None  # cached hash, reset by setters
+
         self.name = name
         self.energy = energy
         self.adsorbed = adsorbed
@@ -40,18 +48,25 @@ class Species:
         return f"{prefix}{self.name}({self.energy}, {self.correction})"
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, Species):
             return False
 
+        # NOTE: energies are compared with a tolerance, thus not
+        # as an exact tuple compare
         return (
-            self.name == other.name
-            and self.adsorbed == other.adsorbed
-            and isclose(self.energy, other.energy, abs_tol=1e-4)
-            and isclose(self.correction, other.correction, abs_tol=1e-4)
+            (self._name, self._adsorbed) == (other._name, other._adsorbed)
+            and isclose(self._energy, other._energy, abs_tol=1e-4)
+            and isclose(self._correction, other._correction, abs_tol=1e-4)
         )
 
     def __hash__(self) -> int:
-        return hash((self.name, self.adsorbed, self.energy))
+        if self._hash is None:
+            self._hash = hash((self._name, self._adsorbed, self._energy))
+
+        return self._hash
 
     @property
     def name(self) -> str:
@@ -61,6 +76,7 @@ class Species:
     @name.setter
     def name(self, name: str):
         self._name = name
+        self._hash = None
 
     @property
     def adsorbed(self) -> bool:
@@ -74,6 +90,7 @@ class Species:
             raise TypeError("Adsorbed should be boolean.")
 
         self._adsorbed = adsorbed
+        self._hash = None
 
     @property
     def energy(self) -> float:
@@ -94,6 +111,7 @@ class Species:
             warnings.warn("Non-negative energy found.")
 
         self._energy = float(energy)
+        self._hash = None
 
     @property
     def correction(self) -> float:
@@ -133,25 +151,15 @@ class Species:
         if not isinstance(string, str):
             raise TypeError("Expect type str.")
 
-        string = string.strip()
-
-        # Check if adsorbed
-        adsorbed: bool = bool(string.startswith("*"))
-
-        # Get energy and correction
-        e_start = string.find("(")
-        e_end = string.find(")")
-        energy_parts = string[e_start + 1 : e_end].split(",")
-        if e_start == -1 or e_end == -1 or len(energy_parts) != 2:
+        if (match := _SPECIES_RE.match(string.strip())) is None:
             raise ValueError("Invalid format for energy and correction.")
 
-        energy = float(energy_parts[0])
-        correction = float(energy_parts[1])
-
-        # Get species name
-        name = string[:e_start].lstrip("*")
-
-        return cls(name, energy, adsorbed, correction)
+        return cls(
+            name=match[2],
+            energy=float(match[3]),
+            adsorbed=bool(match[1]),
+            correction=float(match[4]),
+        )
 
     @classmethod
     def from_dict(cls, dct: dict) -> Self:
@@ -26,7 +26,6 @@ Also more correction terms (ZPE, solvation or such) could also be included.
 
 from __future__ import annotations
 
-import copy
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -58,68 +57,81 @@ class AdsorbToDeltaE:
         self.relation = relation
         self.reaction = reaction
 
-    def _convert_step(self, step: ReactionStep) -> np.ndarray:
-        """Convert adsorption energy Relation to reaction energy change
-        Relation for a single reaction step.
+    def _step_terms(
+        self, step: ReactionStep
+    ) -> tuple[list[int], np.ndarray, float]:
+        """Collect the terms of a single reaction step.
+
+        Each row of the relation coefficient matrix packs the coefficients
+        and intercept of an adsorbate: [coef_0, coef_1, ..., coef_n,
+        intercept]. The matrix and row index are read from the relation
+        (which caches them) on each call, so later changes apply.
+
+        Returns:
+            rows (list[int]): coefficient matrix row of each
+                adsorbed species.
+            numbers (np.ndarray): signed stoichiometric numbers
+                (negative for reactants) of each adsorbed species.
+            constant (float): free species energy and correction terms.
         """
 
-        # Initialize an empty array to store coefficients and intercept
-        # Need number of descriptors + 1 (1 for intercept)
-        coef_array = np.zeros(self.relation.dim + 1)
+        species, numbers = step.stoichiometry
 
-        # Convert the reactants side
-        for spec, num in step.reactants.items():
-            # Pack coefficients and intercept as a single array:
-            # [coef_0, coef_1, ..., coef_n, intercept]
-            if spec.adsorbed:
-                complete_name = f"*{spec.name}"  # "CO2" -> "*CO2"
+        # Only adsorbed species have coefficients
+        # NOTE: for adsorbate "*CO2", the Relation of "*CO2" is used,
+        # while free species/molecules only add to the constant term
+        adsorbed = [idx for idx, spec in enumerate(species) if spec.adsorbed]
+        row_index = self.relation.row_index
+        rows = [row_index[f"*{species[idx].name}"] for idx in adsorbed]
 
-                spec_arr = copy.copy(self.relation.coefficients[complete_name])
-                spec_arr.append(self.relation.intercepts[complete_name])
+        # Free species energy and correction terms for constant
+        # (intercept) term.
+        # NOTE: For adsorbate "*CO2", the energy for free "CO2"
+        # should be added
+        energies = np.array(
+            [spec.energy + spec.correction for spec in species]
+        )
+        constant = float(numbers @ energies)
 
-            else:
-                # For free species/molecules, coefs are zero
-                spec_arr = np.zeros(self.relation.dim + 1)
+        return rows, numbers[adsorbed], constant
 
-            # Add free species energy for adsorbed species to constant
-            # (intercept) term.
-            # NOTE: For adsorbate "*CO2", the energy for free "CO2"
-            # should be added
-            spec_arr[-1] += spec.energy
+    def _convert_step(self, step: ReactionStep) -> np.ndarray:
+        """Convert adsorption energy Relation to reaction energy change
+        Relation for a single reaction step.
 
-            # Add correction term
-            spec_arr[-1] += spec.correction
+        Returns:
+            np.ndarray: coefficients and intercept packed as a single
+                array: [coef_0, coef_1, ..., coef_n, intercept].
+        """
 
-            # NOTE: a minus sign is needed for reactants
-            coef_array -= num * np.array(spec_arr)
+        rows, numbers, constant = self._step_terms(step)
 
-        # Convert the products side
-        for spec, num in step.products.items():
-            if spec.adsorbed:
-                complete_name = f"*{spec.name}"
-                spec_arr = copy.copy(self.relation.coefficients[complete_name])
-                spec_arr.append(self.relation.intercepts[complete_name])
+        coef_array = numbers @ self.relation.coef_matrix[rows]
+        coef_array[-1] += constant
 
-                spec_arr = copy.copy(self.relation.coefficients[complete_name])
-                spec_arr.append(self.relation.intercepts[complete_name])
-            else:
-                spec_arr = np.zeros(self.relation.dim + 1)
+        return coef_array
 
-            # Add energy
-            spec_arr[-1] += spec.energy
+    def convert(self) -> DeltaERelation:
+        """Convert a list of ReactionStep to energy change Relation.
 
-            # Add correction
-            spec_arr[-1] += spec.correction
+        All steps are converted together, as a stoichiometry matrix
+        (steps x species) multiplied by the coefficient matrix.
+        """
 
-            coef_array += num * np.array(spec_arr)
+        steps = self.reaction.steps
+        coef_matrix = self.relation.coef_matrix
 
-        return coef_array
+        stoi_matrix = np.zeros((len(steps), len(coef_matrix)))
+        constants = np.empty(len(steps))
 
-    def convert(self) -> DeltaERelation:
-        """Convert a list of ReactionStep to energy change Relation."""
+        for idx, step in enumerate(steps):
+            rows, numbers, constants[idx] = self._step_terms(step)
 
-        # Work on each step
-        coefs = [self._convert_step(step) for step in self.reaction.steps]
+            # NOTE: rows may repeat (species on both sides)
+            np.add.at(stoi_matrix[idx], rows, numbers)
 
         # Build energy change relation (DeltaERelation)
-        return DeltaERelation(coefficients=coefs)
+        coefs = stoi_matrix @ coef_matrix
+        coefs[:, -1] += constants
+
+        return DeltaERelation(coefficients=list(coefs))
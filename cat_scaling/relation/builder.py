@@ -38,7 +38,6 @@ from math import isclose
 from typing import TYPE_CHECKING
 
 import numpy as np
-from sklearn.linear_model import LinearRegression
 
 from cat_scaling.data import Eads
 from cat_scaling.relation.relation import EadsRelation
@@ -83,21 +82,97 @@ class Builder:
         if not isclose(sum(adsorbate_ratios.values()), 1.0, abs_tol=1e-04):
             raise ValueError("Ratios should sum to 1.0.")
 
-        # Fetch child descriptors
-        child_descriptors = np.array(
-            [
-                self.data.get_adsorbate(adsorbate)
-                for adsorbate in adsorbate_ratios
-            ]
-        )
+        # Fetch child descriptors, as shape (n_descriptors, n_samples)
+        child_descriptors = self.data.get_adsorbates(list(adsorbate_ratios)).T
 
         # Construct composite descriptor (from child descriptors)
-        return np.sum(
-            child_descriptors
-            * np.array(list(adsorbate_ratios.values()))[:, np.newaxis],
-            axis=0,
+        # as a single matrix-vector product
+        ratios = np.fromiter(
+            adsorbate_ratios.values(),
+            dtype=np.float64,
+            count=len(adsorbate_ratios),
         )
 
+        return ratios @ child_descriptors
+
+    @staticmethod
+    def _linear_regression(
+        x: np.ndarray, y: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Ordinary least squares of a single feature in closed form.
+
+        Regressions are performed along the last axis, and leading axes
+        are broadcast, for example x of shape (n_ratios, n_samples) and
+        y of shape (n_samples, ) gives results of shape (n_ratios, ).
+
+        Parameters:
+            x (np.ndarray): feature (the composite descriptor).
+            y (np.ndarray): target.
+
+        Returns:
+            slope (np.ndarray): slope
+            intercept (np.ndarray): intercept
+            r2 (np.ndarray): coefficient of determination (R2)
+        """
+
+        x_mean = x.mean(axis=-1)
+        y_mean = y.mean(axis=-1)
+        dx = x - x_mean[..., np.newaxis]
+        dy = y - y_mean[..., np.newaxis]
+
+        return Builder._regression_from_moments(
+            x_mean=x_mean,
+            y_mean=y_mean,
+            ss_xx=(dx * dx).sum(axis=-1),
+            ss_xy=(dx * dy).sum(axis=-1),
+            ss_yy=(dy * dy).sum(axis=-1),
+        )
+
+    @staticmethod
+    def _regression_from_moments(
+        x_mean: np.ndarray,
+        y_mean: np.ndarray,
+        ss_xx: np.ndarray,
+        ss_xy: np.ndarray,
+        ss_yy: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Single feature least squares from (broadcastable) moments.
+
+        Parameters:
+            x_mean (np.ndarray): mean of feature.
+            y_mean (np.ndarray): mean of target.
+            ss_xx (np.ndarray): centered sum of squares of feature.
+            ss_xy (np.ndarray): centered sum of products.
+            ss_yy (np.ndarray): centered sum of squares of target.
+
+        Returns:
+            slope (np.ndarray): slope
+            intercept (np.ndarray): intercept
+            r2 (np.ndarray): coefficient of determination (R2)
+
+        Note:
+            Degenerate cases follow scikit-learn's LinearRegression:
+            a constant feature gives zero slope, and a constant target
+            gives R2 of 1.0 for a perfect fit (0.0 otherwise).
+        """
+
+        ss_xx, ss_xy, ss_yy = np.broadcast_arrays(ss_xx, ss_xy, ss_yy)
+
+        slope = np.divide(
+            ss_xy, ss_xx, out=np.zeros(ss_xy.shape), where=ss_xx > 0
+        )
+        intercept = y_mean - slope * x_mean
+
+        # Residual sum of squares (clipped for round-off)
+        ss_res = np.maximum(ss_yy - slope * ss_xy, 0.0)
+
+        # Constant target: 1.0 for a perfect fit, 0.0 otherwise
+        r2 = np.where(ss_res == 0, 1.0, 0.0)
+        valid = ss_yy > 0
+        r2[valid] = 1.0 - ss_res[valid] / ss_yy[valid]
+
+        return slope, intercept, r2
+
     def _builder(
         self, adsorbate_name: str, ratios: dict[str, float]
     ) -> tuple[list[float], float, float]:
@@ -129,7 +204,7 @@ class Builder:
             The composite descriptor would be used to perform linear
             regressions for each adsorbate (target), where there would
             be a coefficient, an intercept and a metrics score:
-                coef, intercept, score = LinearRegression(*)
+                coef, intercept, score = least_squares(comp_des, target)
 
             3. Map scaling coefficients to original descriptors:
             As the linear regression is construction upon the composite
@@ -151,21 +226,22 @@ class Builder:
         # Build composite descriptor
         composite_descriptor = self._build_composite_descriptor(ratios)
 
-        # Perform linear regression
-        _comp_des = composite_descriptor.reshape(-1, 1)
-        _target = self.data.get_adsorbate(adsorbate_name).reshape(-1, 1)
-
-        reg = LinearRegression().fit(_comp_des, _target)
+        # Perform linear regression (single feature, in closed form)
+        slope, intercept, metrics = self._linear_regression(
+            composite_descriptor, self.data.get_adsorbate(adsorbate_name)
+        )
 
         # Collect results
         # Map scaling coefficients to original descriptors
         # As there is only the composite descriptor,
         # there should be only one coefficient for composite descriptor.
         # And need to use ratios to map it to all descriptors
-        coefs = [float(reg.coef_[0][0] * ratio) for ratio in ratios.values()]
-        intercept = float(reg.intercept_[0])
-
-        metrics = reg.score(_comp_des, _target)
+        coefs = (
+            float(slope)
+            * np.fromiter(ratios.values(), dtype=np.float64, count=len(ratios))
+        ).tolist()
+        intercept = float(intercept)
+        metrics = float(metrics)
 
         assert len(coefs) == len(ratios), "Internal coef error."
         return coefs, intercept, metrics
@@ -177,11 +253,22 @@ class Builder:
         Returns:
             Relation: A Relation object containing coefficients and metrics
                 of the scaling relations.
+
+        Raises:
+            ValueError: If any descriptor or group member is not found
+                in data, or if a group member is None.
         """
 
         # Get "groups" property from data
         groups = descriptors.groups
 
+        # Check all descriptors and group members exist in data
+        requested = set(groups).union(
+            *(members for members in groups.values() if members is not None)
+        )
+        if missing := requested.difference(self.data.adsorbates):
+            raise ValueError(f"Adsorbates {sorted(missing)} not found.")
+
         coefficients_dict = {}
         intercepts_dict = {}
         metrics_dict = {}
@@ -204,25 +291,115 @@ class Builder:
             metrics_dict[descriptor] = 1.0
             ratios_dict[descriptor] = ratios
 
-            # Build for each adsorbate
-            for ads_name in adsorbate:
-                coefs, intercept, metrics = self._builder(
-                    adsorbate_name=ads_name,
-                    ratios=ratios,
-                )
+            if not adsorbate:
+                continue
+
+            # Build for all adsorbates of the group at once,
+            # with the descriptor and targets fetched only once
+            targets = self.data.get_adsorbates(adsorbate).T
+            slopes, intercepts, scores = self._linear_regression(
+                self.data.get_adsorbate(descriptor), targets
+            )
+
+            # Reshape coefs to consistent shape
+            # (As traditional method uses only one descriptor,
+            # any other coefs would be zero)
+            coefs = np.zeros((len(adsorbate), len(groups)))
+            coefs[:, idx] = slopes
+
+            # Collect results
+            coefficients_dict.update(zip(adsorbate, coefs.tolist()))
+            intercepts_dict.update(zip(adsorbate, intercepts.tolist()))
+            metrics_dict.update(zip(adsorbate, scores.tolist()))
+            ratios_dict.update(dict.fromkeys(adsorbate, ratios))
 
-                # Reshape coefs to consistent shape
-                # (As traditional method uses only one descriptor,
-                # any other coefs would be zero)
-                _coefs = [
-                    coefs[0] if i == idx else 0.0 for i in range(len(groups))
-                ]
+        return EadsRelation(
+            coefficients_dict, intercepts_dict, metrics_dict, ratios_dict
+        )
+
+    def build_grid(self, descriptors: Descriptors) -> EadsRelation:
+        """Build scaling relations the traditional way, with groups
+        assigned automatically: each adsorbate is approximated by the
+        descriptor giving the highest metrics (R2).
+
+        All descriptor-adsorbate pairs are regressed at once, group
+        members in descriptors (if any) are ignored.
 
-                # Collect results
-                coefficients_dict[ads_name] = _coefs
-                intercepts_dict[ads_name] = intercept
-                metrics_dict[ads_name] = metrics
-                ratios_dict[ads_name] = ratios
+        Returns:
+            Relation: A Relation object containing coefficients and metrics
+                of the scaling relations, compatible with the traditional
+                method.
+
+        Raises:
+            ValueError: If any descriptor is not found in data.
+        """
+
+        _descriptors = descriptors.descriptors
+
+        if missing := set(_descriptors).difference(self.data.adsorbates):
+            raise ValueError(f"Adsorbates {sorted(missing)} not found.")
+
+        # Adsorbates to group (excluding descriptors)
+        adsorbates = [
+            ads_name
+            for ads_name in self.data.adsorbates
+            if ads_name not in _descriptors
+        ]
+
+        # Identity coefficients for descriptors themselves
+        identity = np.eye(len(_descriptors)).tolist()
+
+        coefficients_dict = dict(zip(_descriptors, identity))
+        intercepts_dict = dict.fromkeys(_descriptors, 0.0)
+        metrics_dict = dict.fromkeys(_descriptors, 1.0)
+        ratios_dict = {name: {name: 1.0} for name in _descriptors}
+
+        if adsorbates:
+            # Center descriptors, as shape (n_descriptors, n_samples),
+            # and adsorbates, as shape (n_adsorbates, n_samples)
+            descriptors_arr = self.data.get_adsorbates(_descriptors).T
+            targets = self.data.get_adsorbates(adsorbates).T
+
+            descriptors_mean = descriptors_arr.mean(axis=1)
+            targets_mean = targets.mean(axis=1)
+            descriptors_arr -= descriptors_mean[:, np.newaxis]
+            targets -= targets_mean[:, np.newaxis]
+
+            # Regress every adsorbate against every descriptor at once,
+            # with cross products as a single matmul.
+            # Results are of shape (n_descriptors, n_adsorbates)
+            slopes, intercepts, scores = self._regression_from_moments(
+                x_mean=descriptors_mean[:, np.newaxis],
+                y_mean=targets_mean,
+                ss_xx=(descriptors_arr**2).sum(axis=1)[:, np.newaxis],
+                ss_xy=descriptors_arr @ targets.T,
+                ss_yy=(targets**2).sum(axis=1),
+            )
+
+            # Assign each adsorbate to its best descriptor
+            # (the first one for ties)
+            best_indexes = np.argmax(scores, axis=0)
+            ads_indexes = np.arange(len(adsorbates))
+
+            # Only the coefficient of the assigned descriptor is non-zero
+            coefs = np.zeros((len(adsorbates), len(_descriptors)))
+            coefs[ads_indexes, best_indexes] = slopes[
+                best_indexes, ads_indexes
+            ]
+
+            coefficients_dict.update(zip(adsorbates, coefs.tolist()))
+            intercepts_dict.update(
+                zip(adsorbates, intercepts[best_indexes, ads_indexes].tolist())
+            )
+            metrics_dict.update(
+                zip(adsorbates, scores[best_indexes, ads_indexes].tolist())
+            )
+            ratios_dict.update(
+                (ads_name, {_descriptors[best_idx]: 1.0})
+                for ads_name, best_idx in zip(
+                    adsorbates, best_indexes.tolist()
+                )
+            )
 
         return EadsRelation(
             coefficients_dict, intercepts_dict, metrics_dict, ratios_dict
@@ -238,6 +415,7 @@ class Builder:
             descriptors (Descriptors): Descriptors description class.
             step_length (float, optional): A percentage value indicating the
                 step size for searching the optimal ratio. Defaults to 1.0.
+                Rounded such that the searched ratios span [0, 1] evenly.
 
         Returns:
             Relation: A Relation object containing coefficients, intercepts,
@@ -278,48 +456,65 @@ class Builder:
         if len(_descriptors) != 2:
             raise ValueError("Expect two descriptors for adaptive method.")
 
-        coefficients_dict = {}
-        intercepts_dict = {}
-        metrics_dict = {}
-        ratios_dict = {}
-
-        # Iterate over each adsorbate (including descriptors)
-        for ads_name in self.data.adsorbates:
-            # Determine an optimal descriptor mixing ratio
-            scores = {}
-
-            for ratio in np.arange(0, 1 + step_length, step_length):
-                ratios = {
-                    _descriptors[0]: ratio,
-                    _descriptors[1]: 1 - ratio,
-                }
-
-                _coefs, _intercept, metrics = self._builder(
-                    adsorbate_name=ads_name,
-                    ratios=ratios,
-                )
-
-                scores[ratio] = metrics
+        # Mixing ratios of both descriptors, as shape (n_ratios, 2)
+        # NOTE: evenly spaced with exact end points (0 and 1), the step
+        # length is thus rounded such that 1.0 is a multiple of it
+        ratio_grid = np.linspace(0.0, 1.0, round(1.0 / step_length) + 1)
+        ratio_matrix = np.column_stack([ratio_grid, 1 - ratio_grid])
+
+        # Center descriptors, as shape (2, n_samples), and all
+        # adsorbates (including descriptors) as targets,
+        # as shape (n_adsorbates, n_samples)
+        adsorbates = self.data.adsorbates
+
+        descriptors_arr = self.data.get_adsorbates(_descriptors).T
+        targets = self.data.get_adsorbates(adsorbates).T
+
+        descriptors_mean = descriptors_arr.mean(axis=1)
+        targets_mean = targets.mean(axis=1)
+        descriptors_arr -= descriptors_mean[:, np.newaxis]
+        targets -= targets_mean[:, np.newaxis]
+
+        # Regress all targets against all composite descriptors at once,
+        # without building composite descriptors: as composite descriptor
+        # x = ratios @ descriptors is linear, its moments are those of
+        # descriptors combined with ratios. Results are of shape
+        # (n_ratios, n_adsorbates)
+        gram = descriptors_arr @ descriptors_arr.T
+
+        slopes, intercepts, scores = self._regression_from_moments(
+            x_mean=(ratio_matrix @ descriptors_mean)[:, np.newaxis],
+            y_mean=targets_mean,
+            ss_xx=np.einsum("ki,ij,kj->k", ratio_matrix, gram, ratio_matrix)[
+                :, np.newaxis
+            ],
+            ss_xy=ratio_matrix @ (descriptors_arr @ targets.T),
+            ss_yy=(targets * targets).sum(axis=1),
+        )
 
-            # Find and rerun linear regression with the optimal ratio
-            opt_ratio = max(scores, key=scores.get)  # type: ignore[arg-type]
+        # Determine the optimal descriptor mixing ratio for each adsorbate
+        # (the first one for ties)
+        opt_indexes = np.argmax(scores, axis=0)
+        ads_indexes = np.arange(len(adsorbates))
 
-            opt_ratios = {
-                _descriptors[0]: opt_ratio,
-                _descriptors[1]: 1 - opt_ratio,
-            }
+        opt_slopes = slopes[opt_indexes, ads_indexes]
+        opt_ratios = ratio_matrix[opt_indexes]
 
-            coefs, intercept, metrics = self._builder(
-                adsorbate_name=ads_name,
-                ratios=opt_ratios,
-            )
-
-            # Collect results
-            coefficients_dict[ads_name] = coefs
-            intercepts_dict[ads_name] = intercept
-            metrics_dict[ads_name] = metrics
-            ratios_dict[ads_name] = opt_ratios
+        # Map slopes to original descriptors,
+        # as shape (n_adsorbates, n_descriptors)
+        opt_coefs = opt_slopes[:, np.newaxis] * opt_ratios
 
+        # Collect results
         return EadsRelation(
-            coefficients_dict, intercepts_dict, metrics_dict, ratios_dict
+            coefficients=dict(zip(adsorbates, opt_coefs.tolist())),
+            intercepts=dict(
+                zip(adsorbates, intercepts[opt_indexes, ads_indexes].tolist())
+            ),
+            metrics=dict(
+                zip(adsorbates, scores[opt_indexes, ads_indexes].tolist())
+            ),
+            ratios={
+                ads_name: dict(zip(_descriptors, ratios))
+                for ads_name, ratios in zip(adsorbates, opt_ratios.tolist())
+            },
         )
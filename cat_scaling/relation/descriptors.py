@@ -5,6 +5,9 @@ from __future__ import annotations
 import warnings
 from typing import Optional
 
+# Methods for building Relation
+_VALID_METHODS = frozenset({"traditional", "adaptive"})
+
 
 class Descriptors:
     """Helper class to record descriptors.
@@ -58,21 +61,28 @@ class Descriptors:
         if not isinstance(groups, dict):
             raise TypeError("Expect groups as dict.")
 
-        all_members = []  # for check group member overlap
+        seen_members: set[str] = set()  # for check group member overlap
+        overlap = False
 
         for descriptor, members in groups.items():
             if not isinstance(descriptor, str):
                 raise TypeError("Keys in groups dictionary must be strings.")
-            if members is not None:
-                if not isinstance(members, list):
-                    raise TypeError(
-                        "Group members must be lists of strings or None."
-                    )
-
-                all_members.extend(members)
-
-        # Check for group member overlap
-        if len(all_members) != len(set(all_members)):
+            if members is None:
+                continue
+            if not isinstance(members, list):
+                raise TypeError(
+                    "Group members must be lists of strings or None."
+                )
+
+            # Check for group member overlap (in a single pass)
+            if not overlap:
+                for member in members:
+                    if member in seen_members:
+                        overlap = True
+                        break
+                    seen_members.add(member)
+
+        if overlap:
             warnings.warn("Descriptor group members overlap.")
 
         self._groups = groups
@@ -92,10 +102,7 @@ class Descriptors:
 
     @method.setter
     def method(self, method: Optional[str]):
-        if method is not None and method.lower() not in {
-            "traditional",
-            "adaptive",
-        }:
+        if method is not None and method.lower() not in _VALID_METHODS:
             raise ValueError("Invalid method.")
 
         self._method = method.lower() if method is not None else None
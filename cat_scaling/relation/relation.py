@@ -49,6 +49,9 @@ class EadsRelation:
             are species names and the values are lists of
             mixing ratios corresponding to each descriptor.
         dim (int): Dimensionality as the number of descriptors.
+        coef_matrix (np.ndarray): Coefficients and intercepts of all
+            species as a single matrix.
+        row_index (dict[str, int]): Row of each species in coef_matrix.
     """
 
     def __init__(
@@ -60,6 +63,10 @@ class EadsRelation:
     ) -> None:
         """Initialize with coefficients and intercepts."""
 
+        # Cached coefficient matrix and row index, reset by setters
+        self._coef_matrix: np.ndarray | None = None
+        self._row_index: dict[str, int] | None = None
+
         # Set properties
         self.coefficients = coefficients
         self.intercepts = intercepts
@@ -125,7 +132,12 @@ class EadsRelation:
         if len(set(lengths)) > 1:
             raise ValueError("All coefficients must have the same length")
 
-        self._coefficients = coefficients
+        # Copy to keep cached coef_matrix in sync with coefficients
+        self._coefficients = {
+            key: list(value) for key, value in coefficients.items()
+        }
+        self._coef_matrix = None
+        self._row_index = None
 
     @property
     def intercepts(self) -> dict[str, float]:
@@ -145,6 +157,7 @@ class EadsRelation:
         self._intercepts = {
             key: float(value) for key, value in intercepts.items()
         }
+        self._coef_matrix = None
 
     @property
     def dim(self) -> int:
@@ -152,6 +165,67 @@ class EadsRelation:
 
         return len(next(iter(self.coefficients.values())))
 
+    @property
+    def coef_matrix(self) -> np.ndarray:
+        """Coefficients and intercepts as a matrix of shape
+        (n_species, dim + 1), with rows ordered as coefficients:
+            [coef_0, coef_1, ..., coef_n, intercept]
+
+        Note: the matrix is cached and thus read-only. The cache only
+            follows setter reassignment (inputs are copied on set), so
+            do not modify coefficients/intercepts in place.
+        """
+
+        if self._coef_matrix is None:
+            matrix = np.empty((len(self.coefficients), self.dim + 1))
+            matrix[:, :-1] = list(self.coefficients.values())
+            matrix[:, -1] = [
+                self.intercepts[name] for name in self.coefficients
+            ]
+            matrix.flags.writeable = False
+
+            self._coef_matrix = matrix
+
+        return self._coef_matrix
+
+    @property
+    def row_index(self) -> dict[str, int]:
+        """Row of each species in coef_matrix.
+
+        Note: the dict is cached, do not modify it in place.
+        """
+
+        if self._row_index is None:
+            self._row_index = {
+                name: idx for idx, name in enumerate(self.coefficients)
+            }
+
+        return self._row_index
+
+    def predict(self, descriptors: np.ndarray) -> np.ndarray:
+        """Evaluate adsorption energies of all species with a single matmul.
+
+        Args:
+            descriptors (np.ndarray): Descriptor adsorption energies
+                of shape (n_points, dim).
+
+        Returns:
+            np.ndarray: Adsorption energies of shape (n_points, n_species),
+                with columns ordered as coefficients.
+
+        Raises:
+            ValueError: If descriptors is not of shape (n_points, dim).
+        """
+
+        _descriptors = np.asarray(descriptors, dtype=np.float64)
+
+        if _descriptors.ndim != 2 or _descriptors.shape[1] != self.dim:
+            raise ValueError("Expect descriptors of shape (n_points, dim).")
+
+        matrix = self.coef_matrix
+
+        return _descriptors @ matrix[:, :-1].T + matrix[:, -1]
+
     @property
     def metrics(self) -> dict[str, float]:
         """Evaluation metrics (MAE/R2 or such) of this Relation."""
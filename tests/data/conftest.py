@@ -0,0 +1,18 @@
+import pytest
+
+
+@pytest.fixture(scope="session")
+def energy_dict():
+    """Dummy energies (energy, correction) for test, no "*" in names."""
+    return {
+        "A": (-1, 0.5),
+        "B": (-2, 1.0),
+        "C": (-3, 1.5),
+        "H2O_g": (-4, 2.0),
+        "H2_g": (-5, 2.5),
+        "CO2": (-6, 3.0),
+        "COOH": (-7, 3.5),
+        "CO": (-8, 4.0),
+        "H+": (-9, 4.5),
+        "e-": (0, 0),
+    }
@@ -7,45 +7,101 @@ import pytest
 from cat_scaling.data.eads import Eads
 from cat_scaling.utils import PROJECT_ROOT
 
+TEST_DATA_CSV = PROJECT_ROOT / "tests" / "data" / "example_eads_data.csv"
+
+
+@pytest.fixture(scope="session")
+def eads_df():
+    """Example Eads data, parsed only once per test session."""
+    return pd.read_csv(TEST_DATA_CSV, index_col=[0], header=[0])
 
-class Test_eads:
-    test_data_csv = PROJECT_ROOT / "tests" / "data" / "example_eads_data.csv"
 
-    @classmethod
-    @pytest.fixture()
-    def setup_class(cls):
-        cls.test_df = pd.read_csv(cls.test_data_csv, index_col=[0], header=[0])
-        cls.eads = Eads(cls.test_df)
+@pytest.fixture()
+def eads(eads_df):
+    """Fresh Eads for each test, from the parsed data."""
+    return Eads(eads_df)
 
-    def test_init(self, setup_class):
+
+class Test_eads:
+    test_data_csv = TEST_DATA_CSV
+
+    def test_init(self, eads):
         assert isinstance(
-            self.eads.data,
+            eads.data,
             pd.DataFrame,
         )
 
     @pytest.mark.filterwarnings("ignore:Setting an item of incompatible dtype")
-    def test_invalid_dtype(self, setup_class):
+    def test_invalid_dtype(self, eads):
         """Eads expect data with dtype as float."""
         # Inject an invalid data type
-        invalid_data = copy.deepcopy(self.eads.data)
+        invalid_data = copy.deepcopy(eads.data)
         invalid_data.iloc[0, 0] = "wrong_data_type"  # should be float
 
         with pytest.raises(ValueError):
             Eads(data=invalid_data)
 
+    def test_int_dtype_conversion(self):
+        """Eads should convert non-float data to float64."""
+        eads = Eads(pd.DataFrame([[1, 2], [3, 4]], columns=["*A", "*B"]))
+
+        assert (eads.data.dtypes == np.float64).all()
+        assert np.array_equal(eads.get_adsorbate("*B"), np.array([2.0, 4.0]))
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"*A": [1.0, 2.0, 3.0]},  # single column
+            {"*A": [1.0], "*B": [2.0]},  # single row
+            {"*A": [1.0, 2.0], "*B": [3.0, 4.0]},
+        ],
+        ids=["column", "row", "square"],
+    )
+    def test_no_alias_input(self, data):
+        """Eads should not share memory with the input DataFrame."""
+        df = pd.DataFrame(data)
+        eads = Eads(df)
+
+        df.iloc[0, 0] = -9.0
+
+        assert eads.get_adsorbate("*A")[0] == 1.0
+
+    def test_no_alias_added_energies(self, eads):
+        """Added energies should not share memory with the input array."""
+        adsorbate_energies = np.arange(6, dtype=np.float64)
+        eads.add_adsorbate("*new", adsorbate_energies)
+        adsorbate_energies[0] = -1.0
+
+        assert eads.get_adsorbate("*new")[0] == 0.0
+
+        sample_energies = np.arange(7, dtype=np.float64)
+        eads.add_sample("new_sample", sample_energies)
+        sample_energies[0] = -1.0
+
+        assert eads.get_sample("new_sample")[0] == 0.0
+
+    def test_data_copy(self, eads):
+        """In place edits to data should not apply to Eads."""
+        data = eads.data
+        data.iloc[0, 0] = -100.0
+        data["*new"] = 0.0
+
+        assert eads.get_adsorbate("*CO2")[0] == 0.89
+        assert "*new" not in eads.adsorbates
+
     def test_invalid_dataframe_type(self):
         """Eads expect data as pd.DataFrame."""
         with pytest.raises(TypeError):
             Eads(data=np.array([0, 1, 2]))
 
-    def test_property_adsorbates_samples(self, setup_class):
+    def test_property_adsorbates_samples(self, eads):
         # Test property: adsorbates
-        adsorbates = self.eads.adsorbates
+        adsorbates = eads.adsorbates
 
         assert adsorbates == ["*CO2", "*COOH", "*CO", "*OCH3", "*O", "*OH"]
 
         # Test property: samples
-        samples = self.eads.samples
+        samples = eads.samples
 
         assert samples == [
             "Cu@g-C3N4",
@@ -66,59 +122,92 @@ class Test_eads:
         with pytest.raises(ValueError):
             Eads.from_csv(self.test_data_csv.with_suffix(".null"))
 
-    def test_get_adsorbate_sample(self, setup_class):
+    def test_get_adsorbate_sample(self, eads):
         # Test method: get_adsorbate
-        col = self.eads.get_adsorbate("*CO")
+        col = eads.get_adsorbate("*CO")
 
-        assert np.array_equal(
-            col, np.array([3.64, -1.45, 1.51, 0.52, 1.74, -3.97])
-        )
+        assert col.tolist() == [3.64, -1.45, 1.51, 0.52, 1.74, -3.97]
+
+        # Test method: get_adsorbates
+        cols = eads.get_adsorbates(["*CO", "*CO2"])
+
+        assert cols.shape == (6, 2)
+        assert np.array_equal(cols[:, 0], col)
+        assert np.array_equal(cols[:, 1], eads.get_adsorbate("*CO2"))
+
+        with pytest.raises(KeyError, match="not found"):
+            eads.get_adsorbates(["*CO", "*X"])
 
         # Test method: get_sample
-        row = self.eads.get_sample("Cu@g-C3N4")
+        row = eads.get_sample("Cu@g-C3N4")
 
-        assert np.array_equal(
-            row, np.array([0.89, 4.37, 3.64, 3.98, -1.73, 0.17])
-        )
+        assert row.tolist() == [0.89, 4.37, 3.64, 3.98, -1.73, 0.17]
 
-    def test_add_adsorbate(self, setup_class):
-        self.eads.add_adsorbate("new_adsorbate", list(range(6)))
-        assert "new_adsorbate" in self.eads.adsorbates
+    def test_add_adsorbate(self, eads):
+        eads.add_adsorbate("new_adsorbate", list(range(6)))
+        assert "new_adsorbate" in eads.adsorbates
 
-    def test_add_adsorbate_wrong_length(self, setup_class):
+    def test_add_adsorbate_wrong_length(self, eads):
         """Test add a adsorbate column but with inconsistent length."""
         with pytest.raises(ValueError, match="length doesn't match"):
-            self.eads.add_adsorbate("new_adsorbate", list(range(10)))
+            eads.add_adsorbate("new_adsorbate", list(range(10)))
 
-    def test_add_existing_adsorbate(self, setup_class):
+    def test_add_existing_adsorbate(self, eads):
         with pytest.raises(ValueError, match="already exists."):
-            self.eads.add_adsorbate("*CO2", list(range(6)))
+            eads.add_adsorbate("*CO2", list(range(6)))
 
-    def test_add_sample(self, setup_class):
-        self.eads.add_sample("new_sample", list(range(6)))
-        assert "new_sample" in self.eads.samples
+    def test_add_sample(self, eads):
+        eads.add_sample("new_sample", list(range(6)))
+        assert "new_sample" in eads.samples
 
-    def test_add_sample_wrong_length(self, setup_class):
+    def test_add_multiple(self, eads):
+        """Test pending samples/adsorbates are merged in order."""
+        eads.add_sample("new_sample_0", list(range(6)))
+        eads.add_sample("new_sample_1", list(range(1, 7)))
+
+        with pytest.raises(ValueError, match="already exists."):
+            eads.add_sample("new_sample_1", list(range(6)))
+
+        # Adding an adsorbate should include pending samples
+        eads.add_adsorbate("new_adsorbate", list(range(8)))
+
+        assert eads.samples[-2:] == ["new_sample_0", "new_sample_1"]
+        assert eads.adsorbates[-1] == "new_adsorbate"
+        assert np.array_equal(
+            eads.get_sample("new_sample_1"),
+            np.array([1, 2, 3, 4, 5, 6, 7], dtype=float),
+        )
+        assert (eads.data.dtypes == np.float64).all()
+
+    def test_add_sample_wrong_length(self, eads):
         """Test add a adsorbate column but with inconsistent length."""
         with pytest.raises(ValueError, match="length doesn't match"):
-            self.eads.add_sample("new_sample", list(range(10)))
+            eads.add_sample("new_sample", list(range(10)))
 
-    def test_add_existing_sample(self, setup_class):
+    def test_add_existing_sample(self, eads):
         with pytest.raises(ValueError, match="already exists."):
-            self.eads.add_sample("Cu@g-C3N4", list(range(6)))
+            eads.add_sample("Cu@g-C3N4", list(range(6)))
+
+    def test_remove_adsorbate(self, eads, eads_df):
+        eads.remove_adsorbate("*CO2")
+        assert "*CO2" not in eads.adsorbates
+
+        # Values should stay aligned with names
+        assert eads.data.equals(eads_df.drop(columns="*CO2"))
+
+    def test_remove_sample(self, eads, eads_df):
+        eads.remove_sample("Cu@g-C3N4")
+        assert "Cu@g-C3N4" not in eads.samples
 
-    def test_remove_adsorbate(self, setup_class):
-        self.eads.remove_adsorbate("*CO2")
-        assert "*CO2" not in self.eads.adsorbates
+        assert eads.data.equals(eads_df.drop(index="Cu@g-C3N4"))
 
-    def test_remove_sample(self, setup_class):
-        self.eads.remove_sample("Cu@g-C3N4")
-        assert "Cu@g-C3N4" not in self.eads.samples
+    def test_sort_date(self, eads, eads_df):
+        eads.sort_data(targets={"column", "row"})
 
-    def test_sort_date(self, setup_class):
-        self.eads.sort_data(targets={"column", "row"})
+        # Values should stay aligned with names
+        assert eads.data.equals(eads_df.sort_index().sort_index(axis=1))
 
-        assert self.eads.adsorbates == [
+        assert eads.adsorbates == [
             "*CO",
             "*CO2",
             "*COOH",
@@ -127,7 +216,7 @@ class Test_eads:
             "*OH",
         ]
 
-        assert self.eads.samples == [
+        assert eads.samples == [
             "Au@Al2O3",
             "Co@BN",
             "Cu@g-C3N4",
@@ -136,9 +225,9 @@ class Test_eads:
             "Pt@SiO2",
         ]
 
-    def test_sort_date_invalid_targets(self, setup_class):
+    def test_sort_date_invalid_targets(self, eads):
         with pytest.raises(ValueError):
-            self.eads.sort_data(targets={"invalid", "row"})
+            eads.sort_data(targets={"invalid", "row"})
 
         with pytest.raises(ValueError):
-            self.eads.sort_data(targets={"column", "row", "invalid"})
+            eads.sort_data(targets={"column", "row", "invalid"})
@@ -3,22 +3,9 @@ import pytest
 from cat_scaling.data.reaction import Reaction, ReactionStep
 from cat_scaling.data.species import Species
 
-# Dummy energies for test
-energy_dict = {
-    "A": (-1, 0.5),
-    "B": (-2, 1.0),
-    "C": (-3, 1.5),
-    "H2O_g": (-4, 2.0),
-    "H2_g": (-5, 2.5),
-    "CO2": (-6, 3.0),
-    "COOH": (-7, 3.5),
-    "CO": (-8, 4.0),
-    "H+": (-9, 4.5),
-    "e-": (0, 0),
-}
-
-
-@pytest.mark.filterwarnings("ignore:Non-negative energy found")
+pytestmark = pytest.mark.filterwarnings("ignore:Non-negative energy found")
+
+
 class Test_reactionstep:
     def test_init(self):
         reactants = {
@@ -37,21 +24,39 @@ class Test_reactionstep:
         # Test __str__
         assert str(reactionstep) == "1.0*CO2 + 1.0H+ + 1.0e- -> 1.0*COOH"
 
-    def test_neg_stoi_number(self):
-        reactants = {
+        # str should follow setters
+        reactionstep.products = {Species("COOH", -7, True, 3.5): 2}
+        assert str(reactionstep) == "1.0*CO2 + 1.0H+ + 1.0e- -> 2.0*COOH"
+
+        # str should follow changes to contained Species
+        next(iter(reactionstep.products)).name = "CO"
+        assert str(reactionstep) == "1.0*CO2 + 1.0H+ + 1.0e- -> 2.0*CO"
+
+        # Test __slots__ (no instance dict)
+        assert not hasattr(reactionstep, "__dict__")
+
+    @pytest.mark.parametrize("side", ["reactants", "products"])
+    def test_neg_stoi_number(self, side):
+        species = {
             Species("A", -1, True, 0.5): -1,  # negative
             Species("H2O_g", -4, False, 2.0): 2,
         }
-        products = {
+        others = {
             Species("B", -2, True, 1.0): 2,
         }
 
+        sides = (
+            {"reactants": species, "products": others}
+            if side == "reactants"
+            else {"reactants": others, "products": species}
+        )
+
         with pytest.warns(
             UserWarning, match="Negative stoichiometric number found"
         ):
-            ReactionStep(reactants=reactants, products=products)
+            ReactionStep(**sides)
 
-    def test_eq(self):
+    def test_eq(self, energy_dict):
         react_step = "*A + 2H2O_g -> 2*B"
 
         # Initialize from Species
@@ -79,6 +84,21 @@ class Test_reactionstep:
                 reactants=reactants, products=products
             ) != ReactionStep(reactants=products, products=reactants)
 
+    def test_hash(self):
+        species_A = Species("A", -1, True)
+        step = ReactionStep({species_A: 1}, {Species("B", -2, True): 1})
+        other = ReactionStep(
+            {Species("A", -3, True): 1}, {Species("B", -2, True): 1}
+        )
+
+        old_hash = hash(step)
+        assert old_hash != hash(other)
+
+        # Hash should follow energy change of contained Species
+        species_A.energy = -3
+        assert hash(step) != old_hash
+        assert hash(step) == hash(other)
+
     def test_sepa_stoi_number(self):
         spec_string_0 = " *CO2(-6, 3) "
         assert ReactionStep._sepa_stoi_number(spec_string_0) == (
@@ -92,7 +112,13 @@ class Test_reactionstep:
             "H2O_g(-4, 2)",
         )
 
-    def test_from_str(self):
+        # Decimal stoichiometric number
+        assert ReactionStep._sepa_stoi_number("0.5*O(-1, 0)") == (
+            0.5,
+            "*O(-1, 0)",
+        )
+
+    def test_from_str(self, energy_dict):
         react_step = "*A + 2H2O_g -> 2*B"
 
         # Initialize from Species
@@ -121,7 +147,28 @@ class Test_reactionstep:
             reactants=reactants_1, products=products_1
         )
 
-    def test_from_str_invalid(self):
+        # Irregular whitespace and charged species
+        assert ReactionStep.from_str(
+            "*CO2  +  H+ +   e-  ->*COOH", energy_dict
+        ) == ReactionStep.from_str("*CO2 + H+ + e- -> *COOH", energy_dict)
+
+    def test_stoichiometry(self, energy_dict):
+        step = ReactionStep.from_str("*A + 2H2O_g -> 2*B", energy_dict)
+
+        species, numbers = step.stoichiometry
+
+        assert species == (
+            Species("A", -1, True, 0.5),
+            Species("H2O_g", -4, False, 2.0),
+            Species("B", -2, True, 1.0),
+        )
+        assert numbers.tolist() == [-1.0, -2.0, 2.0]
+
+        # Cached stoichiometry should be reset by setters
+        step.products = {Species("C", -3, True, 1.5): 1}
+        assert step.stoichiometry[1].tolist() == [-1.0, -2.0, 1.0]
+
+    def test_from_str_invalid(self, energy_dict):
         with pytest.raises(TypeError, match="Expect a string"):
             ReactionStep.from_str(
                 ["*A", "2H2O_g", "2*B"],  # should be str
@@ -152,13 +199,7 @@ class Test_reactionstep:
             # Pass an invalid type for stoichiometric number
             ReactionStep({}, {Species("COOH", -7, True, 3.5): "1"})
 
-    def test_negative_stoichiometric_number_warning(self):
-        with pytest.warns(UserWarning):
-            # Pass a negative stoichiometric number
-            ReactionStep({Species("CO2", -6, True, 3): -1}, {})
-
 
-@pytest.mark.filterwarnings("ignore:Non-negative energy found")
 class Test_reaction:
     def test_init(self):
         reactants = {
@@ -199,7 +240,7 @@ class Test_reaction:
         with pytest.raises(ValueError, match="Duplicate ReactionStep found"):
             Reaction([reactionstep, reactionstep])
 
-    def test_from_str(self):
+    def test_from_str(self, energy_dict):
         test_str = """
         *A + 2H2O_g -> 2*B
         *B -> *C + H2_g
@@ -213,6 +254,11 @@ class Test_reaction:
             "*B -> *C + H2_g", energy_dict
         )
 
-    def test_from_str_invalid(self):
+        # Species shared across steps should be the same object
+        (product_b,) = reaction[0].products
+        (reactant_b,) = reaction[1].reactants
+        assert product_b is reactant_b
+
+    def test_from_str_invalid(self, energy_dict):
         with pytest.raises(TypeError, match="Expect a str"):
             Reaction.from_str(["*A", "2H2O_g", "2*B"], energy_dict)
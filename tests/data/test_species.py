@@ -18,10 +18,27 @@ class Test_species:
         assert species.adsorbed is True
         assert isclose(species.energy, -1.0)
 
+    def test_slots(self):
+        species = Species("CO2", -1.0, True, -2.0)
+
+        assert not hasattr(species, "__dict__")
+        with pytest.raises(AttributeError):
+            species.state = "g"
+
     def test_eq(self):
         species_0 = Species("CO2", -1.0, True, -2.0)
         assert species_0 != "Invalid type"
 
+    def test_hash(self):
+        species = Species("CO2", -1.0, True, -2.0)
+        assert hash(species) == hash(Species("CO2", -1.0, True, -2.0))
+
+        # Cached hash should be reset by setters
+        old_hash = hash(species)
+        species.energy = -3.0
+        assert hash(species) != old_hash
+        assert hash(species) == hash(Species("CO2", -3.0, True, -2.0))
+
     def test_str(self):
         species_0 = Species("CO2", -1.0, True, -2.0)
         assert str(species_0) == "*CO2(-1.0, -2.0)"
@@ -29,24 +46,38 @@ class Test_species:
         species_1 = Species("H2O_g", -2.0, False, -3.0)
         assert str(species_1) == "H2O_g(-2.0, -3.0)"
 
-    def test_invalid_adsorbed_type(self):
-        with pytest.raises(TypeError, match="Adsorbed should be boolean"):
-            Species("test_species", -1, adsorbed="True")
-
-    def test_invalid_energy_type(self):
-        with pytest.raises(TypeError, match="Energy should be float"):
-            Species("test_species", "hi", adsorbed="True")
-
-    def test_invalid_correction_dtype(self):
-        with pytest.raises(TypeError, match="Correction should be float"):
-            Species("test_species", -1, adsorbed=True, correction="wrong_type")
-
-    def test_from_str(self):
-        species_0 = Species.from_str("*CO2(-1.0, -2.0)")
-        assert species_0 == Species("CO2", -1.0, True, -2.0)
-
-        species_1 = Species.from_str("H2O_g(-2.0, -3.0)")
-        assert species_1 == Species("H2O_g", -2.0, False, -3.0)
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            (
+                {"energy": -1, "adsorbed": "True"},
+                "Adsorbed should be boolean",
+            ),
+            (
+                {"energy": "hi", "adsorbed": "True"},
+                "Energy should be float",
+            ),
+            (
+                {"energy": -1, "adsorbed": True, "correction": "wrong_type"},
+                "Correction should be float",
+            ),
+        ],
+        ids=["adsorbed", "energy", "correction"],
+    )
+    def test_invalid_init_type(self, kwargs, match):
+        with pytest.raises(TypeError, match=match):
+            Species("test_species", **kwargs)
+
+    @pytest.mark.parametrize(
+        ("string", "expected"),
+        [
+            ("*CO2(-1.0, -2.0)", Species("CO2", -1.0, True, -2.0)),
+            ("H2O_g(-2.0, -3.0)", Species("H2O_g", -2.0, False, -3.0)),
+        ],
+        ids=["adsorbed", "free"],
+    )
+    def test_from_str(self, string, expected):
+        assert Species.from_str(string) == expected
 
     def test_from_str_invalid(self):
         with pytest.raises(TypeError, match="Expect type str"):
@@ -57,25 +88,31 @@ class Test_species:
         ):
             Species.from_str("H2O_g(-2.0, -3.0, invalid)")
 
-    def test_from_dict(self):
-        species_0 = Species.from_dict(
-            {
-                "name": "CO2",
-                "energy": -2.5,
-                "adsorbed": True,
-                "correction": 0.1,
-            }
-        )
-        assert species_0 == Species("CO2", -2.5, True, 0.1)
-
-        species_1 = Species.from_dict(
-            {
-                "name": "H2O",
-                "energy": -2,
-                "adsorbed": False,
-            }
-        )
-        assert species_1 == Species("H2O", -2, False, 0.0)
+    @pytest.mark.parametrize(
+        ("species_dict", "expected"),
+        [
+            (
+                {
+                    "name": "CO2",
+                    "energy": -2.5,
+                    "adsorbed": True,
+                    "correction": 0.1,
+                },
+                Species("CO2", -2.5, True, 0.1),
+            ),
+            (
+                {
+                    "name": "H2O",
+                    "energy": -2,
+                    "adsorbed": False,
+                },
+                Species("H2O", -2, False, 0.0),
+            ),
+        ],
+        ids=["with_correction", "default_correction"],
+    )
+    def test_from_dict(self, species_dict, expected):
+        assert Species.from_dict(species_dict) == expected
 
     def test_from_dict_invalid(self):
         with pytest.raises(TypeError, match="Expect a dict"):
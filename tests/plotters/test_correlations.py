@@ -1,16 +1,18 @@
 import pytest
 
 from cat_scaling.data import Eads
-from cat_scaling.plotters.correlations import plot_correlation_matrix
 from cat_scaling.utils import PROJECT_ROOT
 
+TEST_DATA_CSV = PROJECT_ROOT / "tests" / "relation" / "relation_data.csv"
+
 
 @pytest.mark.skip("Plotter skipped.")
 class Test_plot_correlation_matrix:
     def test_plot(self):
+        # NOTE: import here to avoid loading matplotlib while skipped
+        from cat_scaling.plotters.correlations import plot_correlation_matrix
+
         # Import and load test data
-        eads = Eads.from_csv(
-            PROJECT_ROOT / "tests" / "relation" / "relation_data.csv"
-        )
+        eads = Eads.from_csv(TEST_DATA_CSV)
 
         plot_correlation_matrix(eads)
@@ -0,0 +1,46 @@
+import pandas as pd
+import pytest
+
+from cat_scaling.data.eads import Eads
+from cat_scaling.relation.builder import Builder
+from cat_scaling.relation.descriptors import Descriptors
+from cat_scaling.utils import PROJECT_ROOT
+
+TEST_DATA_CSV = PROJECT_ROOT / "tests" / "relation" / "relation_data.csv"
+
+
+@pytest.fixture(scope="session")
+def eads():
+    """Test Eads data, loaded only once per test session.
+
+    NOTE: shared across tests, do not modify it in place.
+    """
+    return Eads(pd.read_csv(TEST_DATA_CSV, index_col=[0], header=[0]))
+
+
+@pytest.fixture(scope="session")
+def builder(eads):
+    """Builder of the test Eads data (stateless, safe to share)."""
+    return Builder(eads)
+
+
+@pytest.fixture(scope="session")
+def adaptive_descriptors():
+    """Descriptors *A and *D for adaptive builder (read-only)."""
+    return Descriptors({"*A": None, "*D": None})
+
+
+@pytest.fixture(scope="session")
+def eads_relation(builder):
+    """EadsRelation built traditionally from the test Eads data.
+
+    NOTE: shared across tests, do not modify it in place.
+    """
+    descriptors = Descriptors(
+        {
+            "*A": ["*B"],
+            "*C": ["*D"],
+        }
+    )
+
+    return builder.build_traditional(descriptors)
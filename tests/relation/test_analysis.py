@@ -2,66 +2,42 @@
 # as currently definition of Relation/Reaction is repeated
 
 import numpy as np
-import pandas as pd
 import pytest
 
-from cat_scaling.data import Eads
 from cat_scaling.data.reaction import Reaction, ReactionStep, Species
 from cat_scaling.relation.analysis import AdsorbToDeltaE
-from cat_scaling.relation.builder import Builder
-from cat_scaling.relation.descriptors import Descriptors
-from cat_scaling.relation.relation import DeltaERelation
-from cat_scaling.utils import PROJECT_ROOT
+from cat_scaling.relation.relation import DeltaERelation, EadsRelation
 
 
-class Test_AdsorbToDeltaE:
-    @pytest.fixture
-    def eads_relation(self):
-        # Load data
-        test_data_csv = (
-            PROJECT_ROOT / "tests" / "relation" / "relation_data.csv"
-        )
-        test_df = pd.read_csv(test_data_csv, index_col=[0], header=[0])
-        eads = Eads(test_df)
-        descriptors = Descriptors(
-            {
-                "*A": ["*B"],
-                "*C": ["*D"],
-            }
-        )
+@pytest.fixture(scope="module")
+def test_reaction():
+    # NOTE: shared across tests, do not modify it in place
+    # Define dummy Species
+    species_A = Species("A", -1, True)
+    species_H2O = Species("H2O", -8, False)
+    species_B = Species("B", -10, True)
 
-        # Build traditionally
-        builder = Builder(eads)
-        relation = builder.build_traditional(descriptors)
-
-        return relation
-
-    @pytest.fixture
-    def test_reaction(self):
-        # Define dummy Species
-        species_A = Species("A", -1, True)
-        species_H2O = Species("H2O", -8, False)
-        species_B = Species("B", -10, True)
+    # Setup a test Reaction
+    reaction = Reaction(
+        [
+            ReactionStep(
+                reactants={species_A: 1, species_H2O: 1},
+                products={species_B: 1},
+            ),
+        ]
+    )
 
-        # Setup a test Reaction
-        reaction = Reaction(
-            [
-                ReactionStep(
-                    reactants={species_A: 1, species_H2O: 1},
-                    products={species_B: 1},
-                ),
-            ]
-        )
+    return reaction
 
-        return reaction
 
+class Test_AdsorbToDeltaE:
     def test_convert_step(self, eads_relation, test_reaction):
         converter = AdsorbToDeltaE(eads_relation, test_reaction)
 
         step_array = converter._convert_step(test_reaction[0])
 
         assert isinstance(step_array, np.ndarray)
-        assert np.allclose(step_array, np.array([9.0, 0.0, -1.0]))
+        assert step_array.tolist() == pytest.approx([9.0, 0.0, -1.0], abs=1e-8)
 
     def test_convert(self, eads_relation, test_reaction):
         converter = AdsorbToDeltaE(eads_relation, test_reaction)
@@ -71,3 +47,67 @@ class Test_AdsorbToDeltaE:
         assert isinstance(deltaE_relation, DeltaERelation)
 
         assert len(deltaE_relation.coefficients) == len(test_reaction)
+        assert deltaE_relation.coefficients[0].tolist() == pytest.approx(
+            [9.0, 0.0, -1.0], abs=1e-8
+        )
+
+    def test_convert_relation_updated(self):
+        # Build a fresh relation, as it would be modified
+        relation = EadsRelation(
+            coefficients={"*A": [1.0], "*B": [0.5]},
+            intercepts={"*A": 0.0, "*B": 0.2},
+            metrics={"*A": 1.0, "*B": 1.0},
+            ratios={"*A": {"*A": 1.0}, "*B": {"*A": 1.0}},
+        )
+        reaction = Reaction(
+            [
+                ReactionStep(
+                    reactants={Species("A", -1, True): 1},
+                    products={Species("B", -10, True): 1},
+                ),
+            ]
+        )
+        converter = AdsorbToDeltaE(relation, reaction)
+
+        assert converter.convert().coefficients[0].tolist() == pytest.approx(
+            [-0.5, -8.8], abs=1e-8
+        )
+
+        # Reassigned intercepts should apply to later conversions
+        relation.intercepts = {"*A": 5.0, "*B": 0.2}
+
+        assert converter.convert().coefficients[0].tolist() == pytest.approx(
+            [-0.5, -13.8], abs=1e-8
+        )
+        assert converter._convert_step(reaction[0]).tolist() == pytest.approx(
+            [-0.5, -13.8], abs=1e-8
+        )
+
+    def test_convert_multi_step(self, eads_relation):
+        species_A = Species("A", -1, True)
+        species_B = Species("B", -10, True)
+        species_D = Species("D", -3, True)
+        species_H2O = Species("H2O", -8, False)
+
+        # *A appears on both sides of the first step
+        reaction = Reaction(
+            [
+                ReactionStep(
+                    reactants={species_A: 1, species_B: 1},
+                    products={species_A: 2},
+                ),
+                ReactionStep(
+                    reactants={species_A: 1, species_H2O: 1},
+                    products={species_D: 1},
+                ),
+            ]
+        )
+        converter = AdsorbToDeltaE(eads_relation, reaction)
+
+        deltaE_relation = converter.convert()
+
+        assert len(deltaE_relation.coefficients) == len(reaction)
+        for step, coefs in zip(reaction, deltaE_relation.coefficients):
+            assert coefs.tolist() == pytest.approx(
+                converter._convert_step(step).tolist(), abs=1e-8
+            )
@@ -1,58 +1,42 @@
 from math import isclose
 
 import numpy as np
-import pandas as pd
 import pytest
+from numpy.testing import assert_allclose
 
-from cat_scaling.data.eads import Eads
 from cat_scaling.relation import Builder, Descriptors
-from cat_scaling.utils import PROJECT_ROOT
 
+# Adsorbate columns of test data
+DES_A = np.array([0, 0.1, 0.2, 0.3, 0.4, 0.5])
+DES_D = np.array([0, -0.1, -0.2, -0.3, -0.4, -0.5])
 
-class Test_builder:
-    test_data_csv = PROJECT_ROOT / "tests" / "relation" / "relation_data.csv"
-
-    @pytest.fixture(autouse=True)
-    def setup_data_load(self):
-        # Data
-        test_df = pd.read_csv(self.test_data_csv, index_col=[0], header=[0])
-        self.eads = Eads(test_df)
 
+class Test_builder:
     def test_invalid_data(self):
         with pytest.raises(TypeError, match="Expect data as 'Eads' type"):
             Builder(data="data")
 
-    def test_build_composite_descriptor(self):
-        builder = Builder(self.eads)
-
-        # Sum of *A and *D should be zeros
-        ratios = {"*A": 0.5, "*D": 0.5}
-        comp_des_0 = builder._build_composite_descriptor(ratios)
-
-        assert np.allclose(comp_des_0, np.zeros(6))
-
-        # Should be just *D
-        ratios = {"*A": 0, "*D": 1}
-        comp_des_1 = builder._build_composite_descriptor(ratios)
-
-        assert np.allclose(
-            comp_des_1, np.array([0, -0.1, -0.2, -0.3, -0.4, -0.5])
-        )
-
-        # Should be just *A
-        ratios = {"*A": 1, "*D": 0}
-        comp_des_2 = builder._build_composite_descriptor(ratios)
-
-        assert np.allclose(comp_des_2, np.array([0, 0.1, 0.2, 0.3, 0.4, 0.5]))
-
+    @pytest.mark.parametrize(
+        ("ratios", "expected"),
+        [
+            # Sum of *A and *D should be zeros
+            ({"*A": 0.5, "*D": 0.5}, np.zeros(6)),
+            ({"*A": 0, "*D": 1}, DES_D),
+            ({"*A": 1, "*D": 0}, DES_A),
+        ],
+        ids=["balanced", "pure_D", "pure_A"],
+    )
+    def test_build_composite_descriptor(self, builder, ratios, expected):
+        comp_des = builder._build_composite_descriptor(ratios)
+
+        assert_allclose(comp_des, expected, atol=1e-8)
+
+    def test_build_composite_descriptor_invalid(self, builder):
         # Test invalid ratio sum (should sum to 1.0)
         with pytest.raises(ValueError, match="Ratios should sum to 1.0"):
             builder._build_composite_descriptor({"*A": 0.5, "*D": 0})
 
-    def test_builder(self):
-        # Prepare Builder
-        builder = Builder(self.eads)
-
+    def test_builder(self, builder):
         # Test fitting *B with *A
         coefs, intercept, metrics = builder._builder(
             adsorbate_name="*B", ratios={"*A": 1}
@@ -60,11 +44,37 @@ class Test_builder:
 
         # Check regression results
         assert len(coefs) == 1
-        assert np.allclose(coefs, [10], atol=0.01)
+        assert_allclose(coefs, [10], atol=0.01)
         assert isclose(intercept, 0, abs_tol=0.01)
         assert isclose(metrics, 1, abs_tol=0.01)
 
-    def test_build_traditional(self):
+    def test_linear_regression(self):
+        x = np.array([0.0, 1.0, 2.0, 3.0])
+
+        slope, intercept, r2 = Builder._linear_regression(x, 2 * x + 1)
+        assert isclose(slope, 2.0)
+        assert isclose(intercept, 1.0)
+        assert isclose(r2, 1.0)
+
+        # Constant feature: zero slope, intercept being target mean
+        slope, intercept, r2 = Builder._linear_regression(np.zeros(4), x)
+        assert slope == 0.0
+        assert isclose(intercept, 1.5)
+        assert r2 == 0.0
+
+        # Constant target: perfect fit
+        _, _, r2 = Builder._linear_regression(x, np.ones(4))
+        assert r2 == 1.0
+
+        # Batched over leading axis
+        slopes, intercepts, r2s = Builder._linear_regression(
+            np.stack([x, 2 * x, np.zeros(4)]), x
+        )
+        assert_allclose(slopes, [1.0, 0.5, 0.0], atol=1e-8)
+        assert_allclose(intercepts, [0.0, 0.0, 1.5], atol=1e-8)
+        assert_allclose(r2s, [1.0, 1.0, 0.0], atol=1e-8)
+
+    def test_build_traditional(self, builder):
         """Test build with traditional single descriptor method.
         Descriptor A: [0, 0.1, 0.2, 0.3, 0.4, 0.5]
         Descriptor B: [0, 1, 2, 3, 4, 5]
@@ -72,9 +82,6 @@ class Test_builder:
         Thus B = 10 * A + 0, coefficient being 10 and intercept being 0
 
         """
-        # Prepare Builder
-        builder = Builder(self.eads)
-
         # Define descriptors
         descriptors = Descriptors(groups={"*A": ["*B"]})
 
@@ -83,24 +90,43 @@ class Test_builder:
 
         # Check scaling results
         assert relation.dim == 1  # only one descriptor *B
-        assert np.allclose(relation.coefficients["*B"], [10], atol=0.01)
+        assert_allclose(relation.coefficients["*B"], [10], atol=0.01)
         assert isclose(relation.intercepts["*B"], 0, abs_tol=0.01)
         assert isclose(relation.metrics["*B"], 1.0, abs_tol=0.01)
 
         # Check descriptor ratio
         assert isclose(relation.ratios["*B"]["*A"], 1.0, abs_tol=0.01)
 
-    def test_build_traditional_invalid(self):
+    def test_build_traditional_invalid(self, builder):
         with pytest.raises(
             ValueError,
             match="Group member for traditional builder cannot be None",
         ):
             descriptors = Descriptors(groups={"*A": None})
 
-            builder = Builder(self.eads)
             builder.build_traditional(descriptors)
 
-    def test_build_adaptive(self):
+    def test_build_traditional_missing_adsorbate(self, builder):
+        with pytest.raises(ValueError, match="not found"):
+            builder.build_traditional(Descriptors(groups={"*A": ["*X"]}))
+
+    def test_build_grid(self, builder):
+        # All adsorbates except *F are linear with *A
+        relation = builder.build_grid(Descriptors({"*F": None, "*A": None}))
+
+        assert relation.dim == 2
+        assert relation.coefficients["*F"] == [1.0, 0.0]
+        assert relation.coefficients["*A"] == [0.0, 1.0]
+
+        assert_allclose(relation.coefficients["*B"], [0, 10], atol=0.01)
+        assert isclose(relation.intercepts["*E"], 1.0, abs_tol=0.01)
+        assert isclose(relation.metrics["*C"], 1.0, abs_tol=0.01)
+        assert relation.ratios["*D"] == {"*A": 1.0}
+
+        with pytest.raises(ValueError, match="not found"):
+            builder.build_grid(Descriptors({"*X": None, "*A": None}))
+
+    def test_build_adaptive(self, builder, adaptive_descriptors):
         """Test build with adaptive descriptor method.
 
         Descriptor A: [0, 0.1, 0.2, 0.3, 0.4, 0.5]
@@ -110,64 +136,49 @@ class Test_builder:
         expected a composite descriptor with (*A * 1 + *D * 0)
         to be the most suitable descriptor.
         """
-        # Define descriptors
-        descriptors = Descriptors(
-            {
-                "*A": None,
-                "*D": None,
-            }
-        )
-
-        # Prepare Builder
-        builder = Builder(self.eads)
-
         # Test with adaptive descriptors *A and *D
-        relation = builder.build_adaptive(descriptors, step_length=1)
+        relation = builder.build_adaptive(adaptive_descriptors, step_length=1)
 
         # Check scaling results
         assert relation.dim == 2
 
-        assert np.allclose(relation.coefficients["*A"], [0, -1], atol=0.01)
+        assert_allclose(relation.coefficients["*A"], [0, -1], atol=0.01)
         assert isclose(relation.intercepts["*A"], 0, abs_tol=0.01)
         assert isclose(relation.metrics["*A"], 1.0, abs_tol=0.01)
 
         assert isclose(relation.ratios["*B"]["*D"], 1, abs_tol=0.01)
 
-    def test_build_adaptive_invalid_warn(self):
-        # Test invalid step length
-        builder = Builder(self.eads)
-        descriptors = Descriptors(
-            {
-                "*A": None,
-                "*D": None,
-            }
-        )
-
-        with pytest.raises(ValueError, match="Illegal step length"):
-            builder.build_adaptive(descriptors, step_length="10")
-
+    @pytest.mark.parametrize("step_length", ["10", 200])
+    def test_build_adaptive_invalid_step_length(
+        self, builder, adaptive_descriptors, step_length
+    ):
         with pytest.raises(ValueError, match="Illegal step length"):
-            builder.build_adaptive(descriptors, step_length=200)
-
-        # Test warning for too small/large step length
-        with pytest.warns(
-            UserWarning, match="Large step length may harm accuracy"
-        ):
-            builder.build_adaptive(descriptors, step_length=20)
+            builder.build_adaptive(
+                adaptive_descriptors, step_length=step_length
+            )
 
-        with pytest.warns(
-            UserWarning, match="Small step length may slow down searching"
-        ):
-            # NOTE: warning: this may slow down unit test
-            builder.build_adaptive(descriptors, step_length=0.09)
+    @pytest.mark.parametrize(
+        ("step_length", "message"),
+        [
+            (20, "Large step length may harm accuracy"),
+            # Just below the threshold (0.1), cheap as ratios are vectorized
+            (0.09, "Small step length may slow down searching"),
+        ],
+        ids=["large", "small"],
+    )
+    def test_build_adaptive_warn(
+        self, builder, adaptive_descriptors, step_length, message
+    ):
+        with pytest.warns(UserWarning, match=message):
+            builder.build_adaptive(
+                adaptive_descriptors, step_length=step_length
+            )
 
+    def test_build_adaptive_invalid_descriptors(self, builder):
         # Test invalid number of descriptors
+        descriptors = Descriptors({"*A": None})
+
         with pytest.raises(
             ValueError, match="Expect two descriptors for adaptive method"
         ):
-            descriptors = Descriptors(
-                {
-                    "*A": None,
-                }
-            )
             builder.build_adaptive(descriptors, step_length=1)
@@ -3,189 +3,201 @@ import pytest
 
 from cat_scaling.relation.relation import DeltaERelation, EadsRelation
 
+# Fixed DeltaERelation coefficients (two steps, two/three descriptors)
+COEFS_3 = (np.array([0.1, 0.2, 0.3]), np.array([0.4, 0.5, 0.6]))
+COEFS_4 = (np.array([0.1, 0.2, 0.3, 0.4]), np.array([0.5, 0.6, 0.7, 0.8]))
+
+# Invalid coefficients (with expected error and message)
+INVALID_COEFFICIENTS = [
+    ([], TypeError, "Coefficients must be a dictionary"),
+    (
+        {1: [1, 2, 3], "b": [0.1, 0.2, 0.3]},
+        TypeError,
+        "Species name must be strings",
+    ),
+    (
+        {"a": "1", "b": [0.1, 0.2, 0.3]},
+        TypeError,
+        "Input coefficients must be lists",
+    ),
+    (
+        {"a": ["1", "2"], "b": [0.1, 0.2, 0.3]},
+        TypeError,
+        "Coefficients must be floats",
+    ),
+    (
+        {"a": [0.1, 0.2], "b": [0.1, 0.2, 0.3]},
+        ValueError,
+        "All coefficients must have the same length",
+    ),
+]
+
+# Invalid intercepts/metrics/ratios (with expected error and message)
+INVALID_PROPERTIES = [
+    ({"intercepts": [1, 0]}, TypeError, "intercepts should be a dict"),
+    (
+        {"intercepts": {"a": "0", "b": 1}},
+        TypeError,
+        "intercept value should be float",
+    ),
+    ({"metrics": [1, 0]}, TypeError, "metric should be a dict"),
+    (
+        {"metrics": {"a": "0.8", "b": 0.9}},
+        TypeError,
+        "metric values should be float",
+    ),
+    (
+        {"ratios": {"b": [0.1, 0.2]}},
+        ValueError,
+        "Each ratio_dict must be a dict",
+    ),
+    (
+        {"ratios": {"b": {"a": 0.9}}},
+        ValueError,
+        "Ratios for each species should sum to one",
+    ),
+    (
+        {"ratios": {"b": {"a": 1.0}, "c": {"d": 0.9, "e": 0.1}}},
+        ValueError,
+        "Ratio dict must have the same length",
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def coef():
+    """Valid EadsRelation coefficients (copied by EadsRelation on set)."""
+    return {"a": [0.1, 0.2, 0.3], "b": [0.0, 0.1, 0.2]}
+
+
+@pytest.fixture(scope="module")
+def intercepts():
+    """Valid EadsRelation intercepts (copied by EadsRelation on set)."""
+    return {"a": 0, "b": 1}
+
+
+@pytest.fixture(scope="module")
+def metrics():
+    """Valid EadsRelation metrics (shared, do not modify in place)."""
+    return {"a": 0.8, "b": 0.9}
+
+
+@pytest.fixture(scope="module")
+def ratios():
+    """Valid EadsRelation ratios (shared, do not modify in place)."""
+    return {"b": {"a": 1.0}}
 
-class Test_EadsRelation:
-    test_metrics = {"a": 0.8, "b": 0.9}
-    test_ratios = {"b": {"a": 1.0}}
-
-    def test_init(self):
-        test_coef = {
-            "a": [0.1, 0.2, 0.3],
-            "b": [0.0, 0.1, 0.2],
-        }
-
-        test_intercepts = {"a": 0, "b": 1}
 
+class Test_EadsRelation:
+    def test_init(self, coef, intercepts, metrics, ratios):
         relation = EadsRelation(
-            test_coef, test_intercepts, self.test_metrics, self.test_ratios
+            coef,
+            intercepts,
+            metrics,
+            ratios,
         )
 
-        assert relation.dim == len(test_coef["a"])
+        assert relation.dim == 3
 
-    def test_invalid_properties(self):
+    def test_coef_matrix_predict(self, metrics, ratios):
         test_coef = {
-            "a": [0.1, 0.2, 0.3],
-            "b": [0.0, 0.1, 0.2],
+            "a": [0.1, 0.2],
+            "b": [0.0, 1.0],
         }
 
-        # Test invalid intercepts
-        with pytest.raises(TypeError, match="intercepts should be a dict"):
-            test_intercepts = [1, 0]
+        relation = EadsRelation(test_coef, {"a": 0, "b": 1}, metrics, ratios)
 
-            EadsRelation(
-                test_coef, test_intercepts, self.test_metrics, self.test_ratios
-            )
-
-        with pytest.raises(TypeError, match="intercept value should be float"):
-            test_intercepts = {"a": "0", "b": 1}
-
-            EadsRelation(
-                test_coef, test_intercepts, self.test_metrics, self.test_ratios
-            )
-
-        # Test invalid metrics
-        test_intercepts = {"a": 0, "b": 1}
-
-        with pytest.raises(TypeError, match="metric should be a dict"):
-            invalid_metrics = [1, 0]
-            EadsRelation(
-                test_coef, test_intercepts, invalid_metrics, self.test_ratios
-            )
+        assert np.allclose(
+            relation.coef_matrix, [[0.1, 0.2, 0.0], [0.0, 1.0, 1.0]]
+        )
+        assert not relation.coef_matrix.flags.writeable
+
+        # Editing input coefficients should not affect the relation
+        test_coef["a"][0] = 9.0
+        assert relation.coefficients["a"] == [0.1, 0.2]
+        assert np.allclose(relation.coef_matrix[0], [0.1, 0.2, 0.0])
+
+        # Cached matrix should be reset by setters
+        relation.intercepts = {"a": 2, "b": 1}
+        assert np.allclose(relation.coef_matrix[:, -1], [2.0, 1.0])
+
+        # Predict for two points
+        eads = relation.predict(np.array([[1.0, 2.0], [0.0, 0.0]]))
+        assert np.allclose(eads, [[2.5, 3.0], [2.0, 1.0]])
+
+        with pytest.raises(ValueError, match="Expect descriptors of shape"):
+            relation.predict(np.array([1.0, 2.0]))
+
+    @pytest.mark.parametrize(
+        ("invalid_kwargs", "error", "match"),
+        INVALID_PROPERTIES,
+        ids=[
+            "intercepts_type",
+            "intercept_value",
+            "metrics_type",
+            "metric_value",
+            "ratio_type",
+            "ratio_sum",
+            "ratio_length",
+        ],
+    )
+    def test_invalid_properties(
+        self, coef, intercepts, metrics, ratios, invalid_kwargs, error, match
+    ):
+        kwargs = {
+            "coefficients": coef,
+            "intercepts": intercepts,
+            "metrics": metrics,
+            "ratios": ratios,
+            **invalid_kwargs,
+        }
 
-        with pytest.raises(TypeError, match="metric values should be float"):
-            invalid_metrics = {"a": "0.8", "b": 0.9}
-            EadsRelation(
-                test_coef, test_intercepts, invalid_metrics, self.test_ratios
-            )
+        with pytest.raises(error, match=match):
+            EadsRelation(**kwargs)
 
-        # Test warning for low metrics
+    def test_low_metrics_warning(self, coef, intercepts, ratios):
         with pytest.warns(UserWarning, match="Low metrics for"):
-            warn_metrics = {"a": 0.1, "b": 0.9}
-            EadsRelation(
-                test_coef, test_intercepts, warn_metrics, self.test_ratios
-            )
-
-        # Test invalid ratios
-        with pytest.raises(ValueError, match="Each ratio_dict must be a dict"):
-            invalid_ratios = {"b": [0.1, 0.2]}
             EadsRelation(
-                test_coef, test_intercepts, self.test_metrics, invalid_ratios
+                coef,
+                intercepts,
+                {"a": 0.1, "b": 0.9},
+                ratios,
             )
 
-        with pytest.raises(
-            ValueError, match="Ratios for each species should sum to one"
-        ):
-            invalid_ratios = {"b": {"a": 0.9}}
-            EadsRelation(
-                test_coef, test_intercepts, self.test_metrics, invalid_ratios
-            )
-
-        with pytest.raises(
-            ValueError, match="Ratio dict must have the same length"
-        ):
-            invalid_ratios = {"b": {"a": 1.0}, "c": {"d": 0.9, "e": 0.1}}
-            EadsRelation(
-                test_coef, test_intercepts, self.test_metrics, invalid_ratios
-            )
-
-    def test_str(self):
-        test_coef = {
-            "a": [0.1, 0.2, 0.3],
-            "b": [0.0, 0.1, 0.2],
-        }
-
-        test_intercept = {"a": 0, "b": 1}
-        test_metrics = {"a": 0.8, "b": 0.9}
-        test_ratios = {"b": {"a": 1.0}}
-
+    def test_str(self, coef, intercepts, metrics, ratios):
         relation = EadsRelation(
-            test_coef, test_intercept, test_metrics, test_ratios
+            coef,
+            intercepts,
+            metrics,
+            ratios,
         )
 
-        assert "coef_0     coef_1     coef_2     intercept" in str(relation)
-        assert "Adsorbate Metrics" in str(relation)
-        assert "Adsorbate Ratios" in str(relation)
-
-    def test_invalid_data_dtype(
-        self,
-    ):
-        invalid_coef = []
-        test_intercept = {"a": 0, "b": 1}
-        with pytest.raises(
-            TypeError, match="Coefficients must be a dictionary"
-        ):
-            EadsRelation(
-                invalid_coef,
-                test_intercept,
-                self.test_metrics,
-                self.test_ratios,
-            )
-
-    def test_invalid_species_name(self):
-        invalid_coef = {
-            1: [1, 2, 3],
-            "b": [0.1, 0.2, 0.3],
-        }
-        test_intercept = {"a": 0, "b": 1}
-        with pytest.raises(TypeError, match="Species name must be strings"):
-            EadsRelation(
-                invalid_coef,
-                test_intercept,
-                self.test_metrics,
-                self.test_ratios,
-            )
-
-    def test_invalid_coef_type(self):
-        invalid_coef_0 = {
-            "a": "1",
-            "b": [0.1, 0.2, 0.3],
-        }
-        test_intercept = {"a": 0, "b": 1}
-        with pytest.raises(
-            TypeError, match="Input coefficients must be lists"
-        ):
-            EadsRelation(
-                invalid_coef_0,
-                test_intercept,
-                self.test_metrics,
-                self.test_ratios,
-            )
+        relation_str = str(relation)
 
-        invalid_coef_1 = {
-            "a": ["1", "2"],
-            "b": [0.1, 0.2, 0.3],
-        }
-        test_intercept = {"a": 0, "b": 1}
-        with pytest.raises(TypeError, match="Coefficients must be floats"):
-            EadsRelation(
-                invalid_coef_1,
-                test_intercept,
-                self.test_metrics,
-                self.test_ratios,
-            )
+        assert "coef_0     coef_1     coef_2     intercept" in relation_str
+        assert "Adsorbate Metrics" in relation_str
+        assert "Adsorbate Ratios" in relation_str
 
-    def test_coef_length_mismatch(self):
-        invalid_coef = {
-            "a": [0.1, 0.2],
-            "b": [0.1, 0.2, 0.3],
-        }
-        test_intercept = {"a": 0, "b": 1}
-        with pytest.raises(
-            ValueError, match="All coefficients must have the same length"
-        ):
+    @pytest.mark.parametrize(
+        ("coefficients", "error", "match"),
+        INVALID_COEFFICIENTS,
+        ids=["not_dict", "species_name", "not_list", "not_float", "length"],
+    )
+    def test_invalid_coefficients(
+        self, intercepts, metrics, ratios, coefficients, error, match
+    ):
+        with pytest.raises(error, match=match):
             EadsRelation(
-                invalid_coef,
-                test_intercept,
-                self.test_metrics,
-                self.test_ratios,
+                coefficients,
+                intercepts,
+                metrics,
+                ratios,
             )
 
 
 class Test_DeltaERelation:
     def test_init(self):
-        delta_E_relation = DeltaERelation(
-            coefficients=[np.random.rand(3), np.random.rand(3)]
-        )
+        delta_E_relation = DeltaERelation(coefficients=list(COEFS_3))
         assert isinstance(delta_E_relation, DeltaERelation)
 
         assert delta_E_relation.dim == 2
@@ -193,24 +205,22 @@ class Test_DeltaERelation:
     def test_invalid_properties(self):
         # Test invalid coefficients
         with pytest.raises(TypeError, match="Coefficients should be a list"):
-            DeltaERelation(coefficients=np.random.rand(3))
+            DeltaERelation(coefficients=COEFS_3[0])
 
         with pytest.raises(
             TypeError, match="All coefficients should be numpy arrays"
         ):
-            DeltaERelation(coefficients=[np.random.rand(3), [0, 1, 2]])
+            DeltaERelation(coefficients=[COEFS_3[0], [0, 1, 2]])
 
         with pytest.raises(
             ValueError,
             match="All coefficient arrays should have the same length",
         ):
-            DeltaERelation(coefficients=[np.random.rand(3), np.random.rand(4)])
+            DeltaERelation(coefficients=[COEFS_3[0], COEFS_4[0]])
 
     def test_eval_limit_potential_2D(self):
         # TODO: improve the unit test to assert value in generate grid points
-        delta_E_relation = DeltaERelation(
-            coefficients=[np.random.rand(3), np.random.rand(3)]
-        )
+        delta_E_relation = DeltaERelation(coefficients=list(COEFS_3))
 
         delta_E_relation.eval_limit_potential_2D(
             x=np.arange(0, 10, 10),
@@ -222,9 +232,7 @@ class Test_DeltaERelation:
         with pytest.raises(
             ValueError, match="Expect a Relation with two descriptors"
         ):
-            delta_E_relation = DeltaERelation(
-                coefficients=[np.random.rand(4), np.random.rand(4)]
-            )
+            delta_E_relation = DeltaERelation(coefficients=list(COEFS_4))
 
             delta_E_relation.eval_limit_potential_2D(
                 x=np.arange(0, 10, 10),
@@ -232,9 +240,7 @@ class Test_DeltaERelation:
             )
 
         # Test invalid base arrays
-        delta_E_relation = DeltaERelation(
-            coefficients=[np.random.rand(3), np.random.rand(3)]
-        )
+        delta_E_relation = DeltaERelation(coefficients=list(COEFS_3))
         with pytest.raises(TypeError, match="Expect 1D x array"):
             delta_E_relation.eval_limit_potential_2D(
                 x=list(range(10)),
@@ -244,5 +250,5 @@ class Test_DeltaERelation:
         with pytest.raises(TypeError, match="Expect 1D y array"):
             delta_E_relation.eval_limit_potential_2D(
                 x=np.arange(0, 10, 10),
-                y=np.random.rand(0, 10, 10, 2),  # should be 1D
+                y=np.zeros((0, 10, 10, 2)),  # should be 1D
             )